@@ -1,67 +1,88 @@
 from spb._version import __version__
-from spb.plot_functions.functions_2d import (
-    plot,
-    plot_parametric,
-    plot_parametric_region,
-    plot_contour,
-    plot_implicit,
-    plot_polar,
-    plot_geometry,
-    plot_list,
-    plot_piecewise
-)
-from spb.plot_functions.functions_3d import (
-    plot3d,
-    plot3d_parametric_line,
-    plot3d_parametric_surface,
-    plot3d_implicit,
-    plot3d_spherical,
-    plot3d_revolution,
-    plot3d_list
-)
-from spb.plot_functions.vectors import plot_vector
-from spb.plot_functions.complex_analysis import (
-    plot_complex, plot_complex_list,
-    plot_real_imag, plot_complex_vector, plot_riemann_sphere
-)
-from spb.plot_functions.control import (
-    plot_pole_zero, plot_step_response, plot_impulse_response,
-    plot_ramp_response, plot_bode_magnitude, plot_bode_phase, plot_bode,
-    plot_nyquist, plot_nichols, plot_root_locus
-)
-from spb.utils import prange
 
-from spb.plotgrid import plotgrid, PlotGrid
+# NOTE: importing plot functions, graphics functions or backends executes a
+# non-negligible amount of code (sympy, numpy, eventually a plotting
+# library). Hence, public names are exposed as lazy attributes (PEP 562):
+# the actual import only happens on first access, and `import spb` stays
+# fast. The names are listed in __all__, so both `from spb import plot` and
+# star imports keep working.
+_lazy_attrs = {}
+for _module, _names in {
+    "spb.plot_functions.functions_2d": [
+        "plot", "plot_parametric", "plot_parametric_region", "plot_contour",
+        "plot_implicit", "plot_polar", "plot_geometry", "plot_list",
+        "plot_piecewise"
+    ],
+    "spb.plot_functions.functions_3d": [
+        "plot3d", "plot3d_parametric_line", "plot3d_parametric_surface",
+        "plot3d_implicit", "plot3d_spherical", "plot3d_revolution",
+        "plot3d_list"
+    ],
+    "spb.plot_functions.vectors": ["plot_vector"],
+    "spb.plot_functions.complex_analysis": [
+        "plot_complex", "plot_complex_list", "plot_real_imag",
+        "plot_complex_vector", "plot_riemann_sphere"
+    ],
+    "spb.plot_functions.control": [
+        "plot_pole_zero", "plot_step_response", "plot_impulse_response",
+        "plot_ramp_response", "plot_bode_magnitude", "plot_bode_phase",
+        "plot_bode", "plot_nyquist", "plot_nichols", "plot_root_locus"
+    ],
+    "spb.utils": ["prange"],
+    "spb.plotgrid": ["plotgrid", "PlotGrid"],
+    "spb.graphics.graphics": ["graphics"],
+    "spb.graphics.functions_2d": [
+        "line", "line_parametric_2d", "line_polar", "contour", "implicit_2d",
+        "list_2d", "geometry", "hline", "vline"
+    ],
+    "spb.graphics.functions_3d": [
+        "surface", "surface_parametric", "surface_revolution",
+        "surface_spherical", "line_parametric_3d", "list_3d", "implicit_3d",
+        "wireframe", "plane"
+    ],
+    "spb.graphics.vectors": [
+        "vector_field_2d", "vector_field_3d", "arrow_2d", "arrow_3d"
+    ],
+    "spb.graphics.complex_analysis": [
+        "complex_points", "line_abs_arg", "line_abs_arg_colored",
+        "line_real_imag", "surface_abs_arg", "surface_real_imag",
+        "domain_coloring", "analytic_landscape", "riemann_sphere_2d",
+        "riemann_sphere_3d", "complex_vector_field", "contour_real_imag",
+        "contour_abs_arg"
+    ],
+    "spb.graphics.control": [
+        "control_axis", "pole_zero", "step_response", "impulse_response",
+        "ramp_response", "bode_magnitude", "bode_phase", "nyquist", "nichols",
+        "root_locus", "sgrid", "zgrid", "ngrid", "mcircles"
+    ],
+    "spb.backends.matplotlib": ["MB"],
+    "spb.backends.bokeh": ["BB"],
+    "spb.backends.plotly": ["PB"],
+    "spb.backends.k3d": ["KB"],
+    "spb.backends.mayavi": ["MAB"],
+}.items():
+    for _name in _names:
+        _lazy_attrs[_name] = _module
 
-from spb.backends.matplotlib import MB
-from spb.backends.bokeh import BB
-from spb.backends.plotly import PB
-from spb.backends.k3d import KB
-from spb.backends.mayavi import MAB
 
-from spb.graphics.graphics import graphics
-from spb.graphics.functions_2d import (
-    line, line_parametric_2d, line_polar, contour, implicit_2d, list_2d,
-    geometry, hline, vline
-)
-from spb.graphics.functions_3d import (
-    surface, surface_parametric, surface_revolution, surface_spherical,
-    line_parametric_3d, list_3d, implicit_3d, wireframe, plane
-)
-from spb.graphics.vectors import (
-    vector_field_2d, vector_field_3d, arrow_2d, arrow_3d
-)
-from spb.graphics.complex_analysis import (
-    complex_points, line_abs_arg, line_abs_arg_colored, line_real_imag,
-    surface_abs_arg, surface_real_imag, domain_coloring, analytic_landscape,
-    riemann_sphere_2d, riemann_sphere_3d, complex_vector_field,
-    contour_real_imag, contour_abs_arg
-)
-from spb.graphics.control import (
-    control_axis, pole_zero, step_response, impulse_response, ramp_response,
-    bode_magnitude, bode_phase, nyquist, nichols, root_locus, sgrid, zgrid,
-    ngrid, mcircles
-)
+def __getattr__(name):
+    if name in _lazy_attrs:
+        import importlib
+        import types
+        value = getattr(importlib.import_module(_lazy_attrs[name]), name)
+        # cache the attribute so that __getattr__ only runs once per name
+        globals()[name] = value
+        # NOTE: a few public names collide with sub-module names (eg the
+        # `plotgrid` function vs the `spb.plotgrid` module): importing a
+        # sub-module binds the module object on this package, shadowing the
+        # corresponding lazy attribute. Re-bind any name that has just been
+        # shadowed, so that functions always win over module objects.
+        for n, m in _lazy_attrs.items():
+            if isinstance(globals().get(n), types.ModuleType):
+                globals()[n] = getattr(importlib.import_module(m), n)
+        return value
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
 
 __all__ = [
     "__version__", "plot", "plot_parametric", "plot_parametric_region",
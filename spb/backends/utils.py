@@ -324,58 +324,36 @@ def get_seeds_points_entry_vector(xx, yy, zz, uu, vv, ww):
     """
     np = import_module('numpy')
 
-    coords = np.stack([xx, yy, zz])
-    # vector field
-    vf = np.stack([uu, vv, ww])
-
-    # extract the coordinate of the points at planes:
-    # x_min, x_max, y_min, y_max, z_min, z_max
-    c_xmin = coords[:, :, 0, :]
-    c_xmax = coords[:, :, -1, :]
-    c_ymin = coords[:, 0, :, :]
-    c_ymax = coords[:, -1, :, :]
-    c_zmin = coords[:, :, :, 0]
-    c_zmax = coords[:, :, :, -1]
-
-    # extract the vector field points at planes:
-    # x_min, x_max, y_min, y_max, z_min, z_max
-    vf_xmin = vf[:, :, 0, :]
-    vf_xmax = vf[:, :, -1, :]
-    vf_ymin = vf[:, 0, :, :]
-    vf_ymax = vf[:, -1, :, :]
-    vf_zmin = vf[:, :, :, 0]
-    vf_zmax = vf[:, :, :, -1]
-
-    def find_points_at_input_vectors(vf_plane, coords, i, sign="g"):
-        check = {
-            "g": lambda x: x > 0,
-            "l": lambda x: x < 0,
-        }
-        # extract coordinates where the vectors are entering the plane
-        tmp = np.where(
-            check[sign](vf_plane[i, :, :]),
-            coords,
-            np.nan * np.zeros_like(coords)
-        )
-        # reshape the matrix to obtain an [n x 3] array of coordinates
-        tmp = np.array(
-            [
-                tmp[0, :, :].flatten(),
-                tmp[1, :, :].flatten(),
-                tmp[2, :, :].flatten()]
-        ).T
-        # remove NaN entries
-        tmp = [a for a in tmp if not np.all([np.isnan(t) for t in a])]
-        return tmp
-
-    p_xmin = find_points_at_input_vectors(vf_xmin, c_xmin, 0, "g")
-    p_xmax = find_points_at_input_vectors(vf_xmax, c_xmax, 0, "l")
-    p_ymin = find_points_at_input_vectors(vf_ymin, c_ymin, 1, "g")
-    p_ymax = find_points_at_input_vectors(vf_ymax, c_ymax, 1, "l")
-    p_zmin = find_points_at_input_vectors(vf_zmin, c_zmin, 2, "g")
-    p_zmax = find_points_at_input_vectors(vf_zmax, c_zmax, 2, "l")
-    # TODO: there could be duplicates
-    points = np.array(p_xmin + p_xmax + p_ymin + p_ymax + p_zmin + p_zmax)
+    def find_points_at_input_vectors(vf_plane, coord_planes, sign="g"):
+        # extract an [n x 3] array with the coordinates of the points where
+        # the vectors are entering the plane, using a single boolean-mask
+        # pass. All the planes are views of the input grids: no stacked
+        # (3, n, m, r) copies are ever materialized.
+        mask = vf_plane > 0 if sign == "g" else vf_plane < 0
+        return np.column_stack([c[mask] for c in coord_planes])
+
+    # for each boundary plane (x_min, x_max, y_min, y_max, z_min, z_max),
+    # select the points where the relevant vector component enters the
+    # volume. NOTE: meshgrid's default indexing places x along axis 1.
+    p_xmin = find_points_at_input_vectors(
+        uu[:, 0, :], (xx[:, 0, :], yy[:, 0, :], zz[:, 0, :]), "g")
+    p_xmax = find_points_at_input_vectors(
+        uu[:, -1, :], (xx[:, -1, :], yy[:, -1, :], zz[:, -1, :]), "l")
+    p_ymin = find_points_at_input_vectors(
+        vv[0, :, :], (xx[0, :, :], yy[0, :, :], zz[0, :, :]), "g")
+    p_ymax = find_points_at_input_vectors(
+        vv[-1, :, :], (xx[-1, :, :], yy[-1, :, :], zz[-1, :, :]), "l")
+    p_zmin = find_points_at_input_vectors(
+        ww[:, :, 0], (xx[:, :, 0], yy[:, :, 0], zz[:, :, 0]), "g")
+    p_zmax = find_points_at_input_vectors(
+        ww[:, :, -1], (xx[:, :, -1], yy[:, :, -1], zz[:, :, -1]), "l")
+    points = np.concatenate(
+        [p_xmin, p_xmax, p_ymin, p_ymax, p_zmin, p_zmax])
+    # corner and edge points belong to multiple boundary planes: drop the
+    # duplicates (keeping the first occurrence) so that downstream
+    # streamline integration doesn't process the same seed twice
+    _, idx = np.unique(points, axis=0, return_index=True)
+    points = points[np.sort(idx)]
 
     return points
 
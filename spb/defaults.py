@@ -208,7 +208,20 @@ def _load_settings():
     check_backend("backend_2D", backends_2D)
     check_backend("backend_3D", backends_3D)
 
-    # load the selected backends
+    # NOTE: the default backend classes are not imported here: the backend
+    # modules import spb.series, which imports this module, so importing
+    # them while this module is being executed would create a circular
+    # import. Instead, TWO_D_B/THREE_D_B are bound on first access by the
+    # module-level __getattr__. Remove eventually stale bindings, so that
+    # a new call to this function (eg from set_defaults) takes effect.
+    frame.f_globals.pop("TWO_D_B", None)
+    frame.f_globals.pop("THREE_D_B", None)
+
+
+def _load_default_backends():
+    """Import the default backend classes selected by the configuration and
+    bind them into this module's namespace.
+    """
     if cfg["backend_2D"] == "plotly":
         from spb.backends.plotly import PlotlyBackend as TWO_D_B
     elif cfg["backend_2D"] == "bokeh":
@@ -228,8 +241,16 @@ def _load_settings():
         elif cfg["backend_3D"] == "k3d":
             from spb.backends.k3d import K3DBackend as THREE_D_B
 
-    frame.f_globals["TWO_D_B"] = TWO_D_B
-    frame.f_globals["THREE_D_B"] = THREE_D_B
+    globals()["TWO_D_B"] = TWO_D_B
+    globals()["THREE_D_B"] = THREE_D_B
+
+
+def __getattr__(name):
+    # PEP 562: this also makes `from spb.defaults import TWO_D_B` work
+    if name in ("TWO_D_B", "THREE_D_B"):
+        _load_default_backends()
+        return globals()[name]
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
 
 def set_defaults(cfg):
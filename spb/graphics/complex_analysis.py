@@ -11,6 +11,7 @@ from spb.utils import (
     prange
 )
 from sympy import I, cos, sin, symbols, pi, re, im, Dummy, Expr
+from collections import ChainMap
 
 
 def complex_points(
@@ -124,10 +125,10 @@ def complex_points(
 def _create_label(label, pre_wrapper):
     if pre_wrapper == "absarg":
         pre_wrapper = "arg"
+    pre = _pre_wrappers[pre_wrapper]
     if not label:
-        return _pre_wrappers[pre_wrapper]
-    else:
-        return _pre_wrappers[pre_wrapper] + "(%s)" % label
+        return pre
+    return pre + "(%s)" % label
 
 
 _pre_wrappers = {
@@ -245,8 +246,9 @@ def _line_helper(keys, expr, range, label, rendering_kw, **kwargs):
         [expr], [range] if range else [], 1, params)[0]
     series = []
     for k in keys:
-        kw = kwargs.copy()
-        kw["return"] = k
+        # only the "return" key changes between series: layer it on top of
+        # the shared kwargs instead of copying the dictionary at each step
+        kw = ChainMap({"return": k}, kwargs)
         series.append(
             LineOver1DRangeSeries(
                 expr, range,
@@ -538,8 +540,7 @@ def _contour_surface_helper(
         [expr], [range] if range else [], 1, params, imaginary=True)[0]
     series = []
     for k in keys:
-        kw = kwargs.copy()
-        kw["return"] = k
+        kw = ChainMap({"return": k}, kwargs)
         cls = ComplexSurfaceSeries if k != "absarg" else ComplexDomainColoringSeries
         series.append(
             cls(expr, range,
@@ -1501,6 +1502,13 @@ def riemann_sphere_3d(expr, rendering_kw=None, colorbar=True, **kwargs):
     return [s1, s2]
 
 
+# dummy variables representing real coordinates on the complex plane.
+# They are shared across calls: re()/im() simplify through the real
+# assumption, and identical expressions substituted with the same dummies
+# hit sympy's internal caches on repeated calls.
+_complex_plane_dummies = symbols("x, y", cls=Dummy, real=True)
+
+
 def complex_vector_field(expr, range=None, **kwargs):
     """Plot the vector field `[re(f), im(f)]` for a complex function `f`
     over the specified complex domain.
@@ -1644,9 +1652,15 @@ def complex_vector_field(expr, range=None, **kwargs):
     range = _create_missing_ranges(
         [expr], [range] if range else [], 1, params, imaginary=True)[0]
     fs = range[0]
-    x, y = symbols("x, y", cls=Dummy)
-    expr1 = re(expr).subs({fs: x + I * y})
-    expr2 = im(expr).subs({fs: x + I * y})
+    x, y = _complex_plane_dummies
+    # substitute the complex variable once: xreplace only performs the
+    # structural symbol-for-expression replacement, skipping the more
+    # expensive matching logic of subs, and re()/im() are then applied to
+    # the already-substituted form instead of walking the tree again
+    mapping = {fs: x + I * y}
+    substituted = expr.xreplace(mapping)
+    expr1 = re(substituted)
+    expr2 = im(substituted)
     r1 = prange(x, re(range[1]), re(range[2]))
     r2 = prange(y, im(range[1]), im(range[2]))
 
@@ -1654,10 +1668,10 @@ def complex_vector_field(expr, range=None, **kwargs):
     scalar = kwargs.get("scalar", None)
     if scalar is not None:
         if isinstance(scalar, Expr):
-            scalar = scalar.subs({fs: x + I * y})
+            scalar = scalar.xreplace(mapping)
         elif isinstance(scalar, (list, tuple)):
             scalar = list(scalar)
-            scalar[0] = scalar[0].subs({fs: x + I * y})
+            scalar[0] = scalar[0].xreplace(mapping)
         kwargs["scalar"] = scalar
 
     return vector_field_2d(expr1, expr2, range1=r1, range2=r2, **kwargs)
@@ -11,6 +11,13 @@ from spb.utils import _preprocess_multiple_ranges
 import warnings
 
 
+# maps a sympy.vector Vector to its matrix form: extracting the coordinate
+# system and converting the vector are full expression-tree walks, and
+# interactive applications split the same vector on every redraw
+_split_vector_cache = {}
+_SPLIT_VECTOR_CACHE_MAXSIZE = 64
+
+
 def _split_vector(expr):
     """Extract the components of the given vector or matrix.
 
@@ -29,8 +36,14 @@ def _split_vector(expr):
     from sympy.physics.vector import Vector as MechVector
 
     if isinstance(expr, Vector):
-        N = list(_get_coord_systems(expr))[0]
-        expr = expr.to_matrix(N)
+        cached = _split_vector_cache.get(expr)
+        if cached is None:
+            N = list(_get_coord_systems(expr))[0]
+            cached = expr.to_matrix(N)
+            if len(_split_vector_cache) >= _SPLIT_VECTOR_CACHE_MAXSIZE:
+                _split_vector_cache.clear()
+            _split_vector_cache[expr] = cached
+        expr = cached
     elif isinstance(expr, MechVector):
         expr = expr.args[0][0]
     elif not isinstance(expr, (DenseMatrix, list, tuple, Tuple)):
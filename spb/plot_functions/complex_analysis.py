@@ -13,8 +13,8 @@ from spb.utils import (
     _unpack_args, _plot_sympify, _check_arguments,
     _is_range, _get_free_symbols
 )
-from spb.plotgrid import plotgrid
 from sympy import latex, Tuple, im, Expr, symbols, I
+from collections import ChainMap
 import warnings
 
 
@@ -24,6 +24,21 @@ import warnings
 # * `absarg` refers to the absolute value and argument, which will be used to
 #   create "domain coloring" plots.
 
+# sequence-like containers accepted by _build_complex_point_series.
+# isinstance against this tuple walks sympy's Tuple MRO: memoize the
+# verdict per concrete type, as the arguments are usually homogeneous.
+_SEQ_TYPES = (list, tuple, Tuple)
+_seq_types_memo = {}
+
+
+def _is_seq(a):
+    tp = type(a)
+    r = _seq_types_memo.get(tp)
+    if r is None:
+        r = _seq_types_memo.setdefault(tp, isinstance(a, _SEQ_TYPES))
+    return r
+
+
 def _build_complex_point_series(*args, allow_lambda=False, pc=False, **kwargs):
     """The following types of arguments are supported by plot_complex_list:
 
@@ -43,16 +58,28 @@ def _build_complex_point_series(*args, allow_lambda=False, pc=False, **kwargs):
     global_labels = kwargs.pop("label", [])
     global_rendering_kw = kwargs.pop("rendering_kw", None)
 
-    if all([isinstance(a, Expr) for a in args]):
+    # classify the arguments with a single pass instead of repeated
+    # all([...]) scans: each flag is only turned off, so the loop can stop
+    # as soon as no classification is possible anymore
+    all_expr = all_seq = all_nonempty = all_first_seq = True
+    for a in args:
+        if all_expr and (not isinstance(a, Expr)):
+            all_expr = False
+        if all_seq:
+            if not _is_seq(a):
+                all_seq = False
+            elif len(a) == 0:
+                all_nonempty = all_first_seq = False
+            elif not _is_seq(a[0]):
+                all_first_seq = False
+        if not (all_expr or all_seq):
+            break
+
+    if all_expr:
         # args is a list of complex numbers
         for a in args:
             series.extend(complex_points(a, **kwargs))
-    elif (
-        (len(args) > 0)
-        and all([isinstance(a, (list, tuple, Tuple)) for a in args])
-        and all([len(a) > 0 for a in args])
-        and all([isinstance(a[0], (list, tuple, Tuple)) for a in args])
-    ):
+    elif (len(args) > 0) and all_seq and all_nonempty and all_first_seq:
         # args is a list of tuples of the form (list, label, rendering_kw)
         # where list contains complex points
         for a in args:
@@ -64,18 +91,16 @@ def _build_complex_point_series(*args, allow_lambda=False, pc=False, **kwargs):
             series.extend(complex_points(
                 expr[0], label=label, rendering_kw=rkw, **kwargs))
     elif (
-        (len(args) > 0)
-        and all([isinstance(a, (list, tuple, Tuple)) for a in args])
-        and all([all([isinstance(t, Expr) and t.is_complex for t in a]) for a in args])
+        (len(args) > 0) and all_seq
+        # the generators short-circuit at the first non-complex element
+        and all(
+            all(isinstance(t, Expr) and t.is_complex for t in a)
+            for a in args)
     ):
         # args is a list of lists
         for a in args:
             series.extend(complex_points(a, **kwargs))
-    elif (
-        (len(args) > 0)
-        and all([isinstance(a, (list, tuple, Tuple)) for a in args])
-        and all([len(a) > 0 for a in args])
-    ):
+    elif (len(args) > 0) and all_seq and all_nonempty:
         # args is a list of tuples of the form (number, label, rendering_kw)
         # where list contains complex points
         for a in args:
@@ -89,7 +114,7 @@ def _build_complex_point_series(*args, allow_lambda=False, pc=False, **kwargs):
 
     else:
         expr, ranges, label, rkw = _unpack_args(*args)
-        if isinstance(expr, (list, tuple, Tuple)):
+        if _is_seq(expr):
             expr = expr[0]
         series.append(complex_points(
             expr, label=label, rendering_kw=rkw, **kwargs))
@@ -134,13 +159,28 @@ def _build_series(*args, interactive=False, allow_lambda=False, **kwargs):
         for e in exprs:
             add_series([e, *r, label, rkw])
 
+    # these flags are common to every expression: extract them once, instead
+    # of copying and re-popping the whole kwargs dictionary for each series
+    absarg = kwargs.pop("absarg", True)
+    real = kwargs.pop("real", False)
+    imag = kwargs.pop("imag", False)
+    _abs = kwargs.pop("abs", False)
+    _arg = kwargs.pop("arg", False)
+    threed = kwargs.pop("threed", False)
+
+    # deciding between lines and surfaces evaluates the imaginary part of
+    # the range extrema through sympy: do it once per range, not once per
+    # expression (multiple expressions usually share the same range)
+    is_line_memo = {}
+
     for a in new_args:
         expr, ranges, label, rend_kw = a[0], a[1:-2], a[-2], a[-1]
         if label is None:
             label = str(expr)
 
-        kw = kwargs.copy()
-        kw["rendering_kw"] = rend_kw
+        # only rendering_kw changes between expressions: layer the delta
+        # on top of the shared kwargs instead of copying the dictionary
+        kw = ChainMap({"rendering_kw": rend_kw}, kwargs)
         if (not allow_lambda) and callable(expr):
             raise TypeError("expr must be a symbolic expression.")
 
@@ -165,13 +205,11 @@ def _build_series(*args, interactive=False, allow_lambda=False, **kwargs):
         #    the series are going to evaluate the complex function and then
         #    extract the required data.
 
-        absarg = kw.pop("absarg", True)
-        real = kw.pop("real", False)
-        imag = kw.pop("imag", False)
-        _abs = kw.pop("abs", False)
-        _arg = kw.pop("arg", False)
-
-        if im(ranges[0][1]) == im(ranges[0][2]):
+        is_line = is_line_memo.get(ranges[0])
+        if is_line is None:
+            is_line = im(ranges[0][1]) == im(ranges[0][2])
+            is_line_memo[ranges[0]] = is_line
+        if is_line:
             # dealing with lines
             if absarg:
                 series.extend(
@@ -185,7 +223,6 @@ def _build_series(*args, interactive=False, allow_lambda=False, **kwargs):
                     line_abs_arg(
                         expr, ranges[0], label, abs=_abs, arg=_arg, **kw))
         else:
-            threed = kw.pop("threed", False)
             if absarg:
                 func = analytic_landscape if threed else domain_coloring
                 asd = func(expr, ranges[0], label, **kw)
@@ -224,39 +261,53 @@ def _set_axis_labels(series, kwargs):
     """Set the axis labels for the plot, depending on the series being
     visualized.
     """
-    if all(s.is_parametric for s in series):
+    # collect in a single pass all the flags needed by the branches below,
+    # instead of scanning the series multiple times with all()/any()
+    all_parametric = all_complex_plane = True
+    has_domain_coloring = has_aspect_series = False
+    for s in series:
+        if all_parametric and (not s.is_parametric):
+            all_parametric = False
+        if all_complex_plane and not (
+            s.is_domain_coloring or s.is_3Dsurface or s.is_contour or
+            isinstance(s, ComplexPointSeries) or s.is_parametric
+        ):
+            all_complex_plane = False
+        if s.is_domain_coloring:
+            has_domain_coloring = True
+        if (
+            (s.is_complex and s.is_domain_coloring and (not s.is_3D))
+            or s.is_point
+        ):
+            has_aspect_series = True
+
+    if all_parametric:
         if kwargs.get("xlabel", None) is None:
             kwargs["xlabel"] = "Real"
         if kwargs.get("ylabel", None) is None:
             kwargs["ylabel"] = "Abs"
-    elif all(s.is_domain_coloring or s.is_3Dsurface or s.is_contour or
-        isinstance(s, ComplexPointSeries) or
-        s.is_parametric for s in series):
+    elif all_complex_plane:
         # when plotting real/imaginary or domain coloring/3D plots, the
         # horizontal axis is the real, the vertical axis is the imaginary
         if kwargs.get("xlabel", None) is None:
             kwargs["xlabel"] = "Re"
         if kwargs.get("ylabel", None) is None:
             kwargs["ylabel"] = "Im"
-        if kwargs.get("zlabel", None) is None and any(s.is_domain_coloring for s in series):
+        if kwargs.get("zlabel", None) is None and has_domain_coloring:
             kwargs["zlabel"] = "Abs"
     else:
         var = series[0].var
 
         if kwargs.get("xlabel", None) is None:
             fx = lambda use_latex: var.name if not use_latex else latex(var)
-            kwargs.setdefault("xlabel", fx)
+            kwargs["xlabel"] = fx
         if kwargs.get("ylabel", None) is None:
             wrap = lambda use_latex: "f(%s)" if not use_latex else r"f\left(%s\right)"
             x = kwargs["xlabel"] if callable(kwargs["xlabel"]) else lambda use_latex: kwargs["xlabel"]
             fy = lambda use_latex: wrap(use_latex) % x(use_latex)
-            kwargs.setdefault("ylabel", fy)
+            kwargs["ylabel"] = fy
 
-    if (
-        kwargs.get("aspect", None) is None) and any(
-            (s.is_complex and s.is_domain_coloring and (not s.is_3D))
-            or s.is_point for s in series
-    ):
+    if (kwargs.get("aspect", None) is None) and has_aspect_series:
         # set aspect equal for 2D domain coloring or complex points
         kwargs.setdefault("aspect", "equal")
 
@@ -1178,6 +1229,10 @@ def plot_riemann_sphere(
         template=kwargs.get("template", None),
         ncols=kwargs.get("ncols", 2),
     )
+    # NOTE: spb.plotgrid imports every plotting library as well as the
+    # interactive modules. Import it here, so that plot functions not
+    # using it don't pay its import cost.
+    from spb.plotgrid import plotgrid
     pg = plotgrid(
         p1, p2, nc=2, imagegrid=True, size=size, show=False,
         **pg_interactive_kwargs)
@@ -7,6 +7,7 @@ from spb.interactive import IPlot, create_interactive_plot
 from spb.utils import _aggregate_parameters
 from sympy.utilities.exceptions import sympy_deprecation_warning
 from sympy.external import import_module
+from itertools import product
 
 
 # NOTE: the code in this module, particularly the one about interactive widget
@@ -15,24 +16,46 @@ from sympy.external import import_module
 # work with different plotting libraries...
 
 
+# keep track of whether panel's extensions have already been loaded, so that
+# repeated calls to ``_create_panel_figure`` don't pay the cost again
+_pn_extension_loaded = False
+
+# memoized result of the matplotlib import, shared by the functions below
+_matplotlib = None
+
+
+def _get_matplotlib():
+    """Import matplotlib on first call: later calls skip import_module's
+    sys.modules lookup and version check.
+    """
+    global _matplotlib
+    if _matplotlib is None:
+        _matplotlib = import_module(
+            'matplotlib',
+            import_kwargs={'fromlist': ['pyplot', 'gridspec']},
+            min_module_version='1.1.0',
+            catch=(RuntimeError,))
+    return _matplotlib
+
+
 def _nrows_ncols(nr, nc, nplots):
     """Define the correct number of rows and/or columns based on the number
     of plots to be shown.
     """
-    np = import_module('numpy')
-
+    # -(-a // b) is the ceiling of a / b using integer arithmetic only
     if (nc <= 0) and (nr <= 0):
         nc = 1
         nr = nplots
     elif nr <= 0:
-        nr = int(np.ceil(nplots / nc))
+        nr = -(-nplots // nc)
     elif nc <= 0:
-        nc = int(np.ceil(nplots / nr))
+        nc = -(-nplots // nr)
     elif nr == 1:
         nc = nplots
     elif nr * nc < nplots:
-        nr += 1
-        return _nrows_ncols(nr, nc, nplots)
+        # grow the number of rows until all plots fit: equivalent to
+        # repeatedly adding one row, without the recursion
+        nr = -(-nplots // nc)
     return nr, nc
 
 
@@ -40,21 +63,32 @@ def _are_all_plots_instances_of(plots, Backend):
     """Verify that plots (or interactive plots) are produces with the
     specified backend.
     """
-    return all(
-        isinstance(t, Backend) or
-        (isinstance(t, IPlot) and isinstance(t.backend, Backend))
-        for t in plots
-    )
+    # grids are often composed of many plots sharing a few types: remember
+    # the types already checked so that isinstance only runs once per type,
+    # and bail out at the first plot produced by another backend
+    ok_types = set()
+    for t in plots:
+        tp = type(t)
+        if tp in ok_types:
+            continue
+        if (tp is Backend) or issubclass(tp, Backend):
+            ok_types.add(tp)
+        elif isinstance(t, IPlot) and isinstance(t.backend, Backend):
+            # interactive plots wrap a backend instance: the wrapped type
+            # must be verified on each plot
+            continue
+        else:
+            return False
+    return True
 
 
 def _create_mpl_figure(
     mapping, imagegrid=False, size=None, is_iplot_panel=False
 ):
-    matplotlib = import_module(
-        'matplotlib',
-        import_kwargs={'fromlist': ['pyplot', 'gridspec']},
-        min_module_version='1.1.0',
-        catch=(RuntimeError,))
+    # mapping is a list of (SubplotSpec, plot) pairs: cheaper to build and
+    # iterate than a dictionary keyed by SubplotSpec, and insertion order
+    # is explicit
+    matplotlib = _get_matplotlib()
     mpl_toolkits = import_module(
         'mpl_toolkits',
         import_kwargs={'fromlist': ['axes_grid1']},
@@ -70,7 +104,7 @@ def _create_mpl_figure(
     new_plots = []
     panes_plots = {}
     if imagegrid:
-        gs = list(mapping.keys())[0].get_gridspec()
+        gs = mapping[0][0].get_gridspec()
         grid = mpl_toolkits.axes_grid1.ImageGrid(
             fig, 111,
             nrows_ncols=(gs.nrows, gs.ncols),
@@ -80,7 +114,7 @@ def _create_mpl_figure(
             cbar_size="7%",
             cbar_pad=0.15,
         )
-        for (_, p), ax in zip(mapping.items(), grid):
+        for (_, p), ax in zip(mapping, grid):
             if isinstance(p, IPlot):
                 p = p.backend
             # cpa: current plot attributes
@@ -93,18 +127,29 @@ def _create_mpl_figure(
             new_plots.append(p)
         return fig, new_plots
 
-    for spec, p in mapping.items():
+    for spec, p in mapping:
         if isinstance(p, IPlot):
             p = p.backend
-        kw = {"projection": "3d"} if (len(p.series) > 0 and
-            p.series[0].is_3D) else ({"projection": "polar"} if p.polar_axis
-            else {})
-        cur_ax = fig.add_subplot(spec, **kw)
-        # cpa: current plot attributes
-        cpa = p._copy_kwargs()
-        cpa["fig"] = fig
-        cpa["ax"] = cur_ax
-        p = MB(*p.series, **cpa)
+        projection = None
+        if p.series and p.series[0].is_3D:
+            projection = "3d"
+        elif p.polar_axis:
+            projection = "polar"
+        cur_ax = fig.add_subplot(spec, projection=projection)
+        if isinstance(p, MB) and (not hasattr(p, "_ax")):
+            # the plot has not yet created its own figure (show=False):
+            # point it to the grid's figure/axes and draw it directly,
+            # instead of re-instantiating an identical plot object
+            p._plotgrid_fig = fig
+            p._plotgrid_ax = cur_ax
+            p._use_existing_figure = True
+            p._init_cyclers()
+        else:
+            # cpa: current plot attributes
+            cpa = p._copy_kwargs()
+            cpa["fig"] = fig
+            cpa["ax"] = cur_ax
+            p = MB(*p.series, **cpa)
         p.draw()
         new_plots.append(p)
 
@@ -118,14 +163,14 @@ def _check_gs(gs):
     if not isinstance(gs, dict):
         raise TypeError("`gs` must be a dictionary.")
 
-    matplotlib = import_module(
+    # only matplotlib.gridspec is needed here: don't trigger the pyplot
+    # import when validating the layout of a non-matplotlib grid
+    SubplotSpec = import_module(
         'matplotlib',
-        import_kwargs={'fromlist': ['pyplot', 'gridspec']},
+        import_kwargs={'fromlist': ['gridspec']},
         min_module_version='1.1.0',
-        catch=(RuntimeError,))
-
-    SubplotSpec = matplotlib.gridspec.SubplotSpec
-    if not isinstance(list(gs.keys())[0], SubplotSpec):
+        catch=(RuntimeError,)).gridspec.SubplotSpec
+    if not isinstance(next(iter(gs)), SubplotSpec):
         raise ValueError(
             "Keys of `gs` must be of elements of type "
             "matplotlib.gridspec.SubplotSpec. Use "
@@ -389,7 +434,7 @@ class IpywidgetsEnabler:
 
         fig = ipy.GridspecLayout(**panel_kw)
         bokeh_outputs_plots = []
-        for spec, p in mapping.items():
+        for spec, p in mapping:
             rs = spec.rowspan
             cs = spec.colspan
             plot_fig = p.fig
@@ -412,7 +457,9 @@ class IpywidgetsEnabler:
                     bokeh.io.show(plot_fig)
                 bokeh_outputs_plots.append((new_fig, p))
                 plot_fig = new_fig
-            fig[slice(rs.start, rs.stop), slice(cs.start, cs.stop)] = ipy.Box([plot_fig])
+            # rowspan/colspan are range objects: their start/stop attributes
+            # already follow slice semantics
+            fig[rs.start:rs.stop, cs.start:cs.stop] = ipy.Box([plot_fig])
         return fig, bokeh_outputs_plots
 
 
@@ -434,6 +481,10 @@ class PanelEnabler:
         # this is set by spb.interactive.animation.panel. It allows to access
         # the animation data
         self._animation = None
+        # maps a layout (tuple of row/column spans) to an already built
+        # pn.GridSpec, so that rebuilding a figure with an identical layout
+        # skips the GridSpec construction
+        self._panel_fig_cache = {}
 
     def pre_set_bindings(self, symbols, widgets):
         """Set the necessary data to create bindings for interactive widgets
@@ -470,20 +521,36 @@ class PanelEnabler:
         return p.fig.to_dict()
 
     def _create_panel_figure(self, mapping):
+        global _pn_extension_loaded
         pn = import_module(
             'panel',
             min_module_version='0.12.0')
-        pn.extension("plotly")
+        if not _pn_extension_loaded:
+            # loading panel's extensions is expensive: only do it on the
+            # first panel-based figure of the session
+            pn.extension("plotly")
+            _pn_extension_loaded = True
 
         panes_plots = {}
-        fig = pn.GridSpec(**self.panel_kw)
+        # pn.GridSpec construction is not cheap: when this grid is rebuilt
+        # with the very same layout (eg inside an interactive callback),
+        # reuse the previous skeleton and only swap in the new panes
+        layout_key = tuple(
+            (s.rowspan.start, s.rowspan.stop, s.colspan.start, s.colspan.stop)
+            for s, _ in mapping)
+        fig = self._panel_fig_cache.get(layout_key)
+        if fig is None:
+            fig = pn.GridSpec(**self.panel_kw)
+            self._panel_fig_cache[layout_key] = fig
+        else:
+            fig.objects.clear()
         create_binding = self._params_symbols is not None
         update_func = self._update_plot
         update_func_plotly = self._update_plotly
         if self._is_animation:
             update_func = self._update_plot_animation
             update_func_plotly = self._update_plotly_animation
-        for i, (spec, p) in enumerate(mapping.items()):
+        for spec, p in mapping:
             rs = spec.rowspan
             cs = spec.colspan
             if isinstance(p, IPlot):
@@ -512,7 +579,7 @@ class PanelEnabler:
                     _fig if not create_binding else
                     pn.bind(update_func, p, *self._params_widgets)
                 )
-            fig[slice(rs.start, rs.stop), slice(cs.start, cs.stop)] = pane
+            fig[rs.start:rs.stop, cs.start:cs.stop] = pane
             panes_plots[pane] = p
         return fig, panes_plots
 
@@ -525,13 +592,6 @@ class PlotGrid(PanelEnabler, IpywidgetsEnabler):
 
     def __init__(self, nrows, ncolumns, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.matplotlib = import_module(
-            'matplotlib',
-            import_kwargs={'fromlist': ['pyplot', 'gridspec']},
-            min_module_version='1.1.0',
-            catch=(RuntimeError,))
-        self.plt = self.matplotlib.pyplot
-
         self.nrows = nrows
         self.ncolumns = ncolumns
         self.args = args
@@ -559,15 +619,16 @@ class PlotGrid(PanelEnabler, IpywidgetsEnabler):
         self.gs = kwargs.get("gs", None)
         if self.gs:
             _check_gs(self.gs)
-            self.is_matplotlib_fig = _are_all_plots_instances_of(
-                self.gs.values(), MB)
-            self.is_bokeh_fig = _are_all_plots_instances_of(
-                self.gs.values(), BB)
             self._all_plots = list(self.gs.values())
         else:
-            self.is_matplotlib_fig = _are_all_plots_instances_of(args, MB)
-            self.is_bokeh_fig = _are_all_plots_instances_of(args, BB)
             self._all_plots = args
+        self.is_matplotlib_fig = _are_all_plots_instances_of(
+            self._all_plots, MB)
+        # a figure composed of Matplotlib plots can't also be composed of
+        # Bokeh plots: skip the second scan in that case
+        self.is_bokeh_fig = (
+            (not self.is_matplotlib_fig) and
+            _are_all_plots_instances_of(self._all_plots, BB))
 
         self._is_animation = kwargs.get("is_animation", any(
             isinstance(p, BaseAnimation) for p in self._all_plots
@@ -578,6 +639,17 @@ class PlotGrid(PanelEnabler, IpywidgetsEnabler):
         if kwargs.get("show", True):
             self.show()
 
+    # NOTE: initializing pyplot might be expensive (GUI-backend probing).
+    # Only do it when Matplotlib is actually needed, not when this object
+    # is instantiated (the grid might be composed of other backends).
+    @property
+    def matplotlib(self):
+        return _get_matplotlib()
+
+    @property
+    def plt(self):
+        return self.matplotlib.pyplot
+
     @property
     def backend(self):
         # TODO: follow sympy doc procedure to create this deprecation
@@ -625,24 +697,33 @@ class PlotGrid(PanelEnabler, IpywidgetsEnabler):
             self.fig.save(path, **kwargs)
 
     def _create_figure(self, **kwargs):
-        GridSpec = self.matplotlib.gridspec.GridSpec
         gs = self.gs
         is_iplot_panel = self._is_iplot and (self._imodule == "panel")
 
         if (gs is None) and (len(self.args) == 0):
-            self._fig = self.plt.figure()
+            # there is nothing to draw: create the empty figure only once,
+            # even if this method runs again (eg on each show())
+            if self._fig is None:
+                self._fig = self.plt.figure()
 
         elif (gs is None):
-            # First mode of operation
+            # First mode of operation.
+            # Building the spec mapping only requires matplotlib.gridspec:
+            # avoid the pyplot import (and its GUI-backend selection) when
+            # the grid is composed of non-matplotlib plots
+            matplotlib = import_module(
+                'matplotlib',
+                import_kwargs={'fromlist': ['gridspec']},
+                min_module_version='1.1.0',
+                catch=(RuntimeError,))
             nr, nc = self.nrows, self.ncolumns
-            gs = GridSpec(nr, nc)
-            mapping = {}
-            c = 0
-            for i in range(nr):
-                for j in range(nc):
-                    if c < len(self.args):
-                        mapping[gs[i, j]] = self.args[c]
-                    c += 1
+            gs = matplotlib.gridspec.GridSpec(nr, nc)
+            # zip stops at the shortest iterable: cells of the last
+            # (eventually incomplete) row are left empty
+            mapping = [
+                (gs[i, j], p) for (i, j), p in
+                zip(product(range(nr), range(nc)), self.args)
+            ]
 
             if self.is_matplotlib_fig:
                 self._fig, self._new_plots = _create_mpl_figure(
@@ -675,10 +756,12 @@ class PlotGrid(PanelEnabler, IpywidgetsEnabler):
                         mapping, self.panel_kw)
 
         else:
-            # Second mode of operation
+            # Second mode of operation: the user-provided gs is a dictionary,
+            # the helpers work on lists of (SubplotSpec, plot) pairs
+            mapping = list(gs.items())
             if self.is_matplotlib_fig:
                 self._fig, self._new_plots = _create_mpl_figure(
-                    gs, self.imagegrid, self.size, is_iplot_panel)
+                    mapping, self.imagegrid, self.size, is_iplot_panel)
             else:
                 for plot in gs.values():
                     if isinstance(plot, IPlot):
@@ -688,14 +771,13 @@ class PlotGrid(PanelEnabler, IpywidgetsEnabler):
 
                 if self._imodule == "panel":
                     self._fig, self._panes_plots = self._create_panel_figure(
-                        gs)
+                        mapping)
                 else:
-                    first_element = list(gs.keys())[0]
-                    mpl_gs = first_element.get_gridspec()
+                    mpl_gs = mapping[0][0].get_gridspec()
                     self.panel_kw = {
                         "n_rows": mpl_gs.nrows, "n_columns": mpl_gs.ncols}
                     self._fig, self._bokeh_outputs_plots = self._create_ipywidgets_figure(
-                        gs, self.panel_kw)
+                        mapping, self.panel_kw)
 
     def update_interactive(self, params):
         """Implement the logic to update the data generated by
@@ -743,7 +825,8 @@ class PlotGrid(PanelEnabler, IpywidgetsEnabler):
             self._create_figure()
 
         if self.is_matplotlib_fig:
-            if not self.imagegrid:
+            if (not self.imagegrid) and self._fig.axes:
+                # no point in solving the layout of an empty figure
                 self._fig.tight_layout()
             self.plt.show(**kwargs)
         else:
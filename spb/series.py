@@ -10,7 +10,8 @@ from sympy import (
     Equality, Ne, GreaterThan, LessThan, StrictLessThan, StrictGreaterThan,
     Plane, Polygon, Circle, Ellipse, Segment, Ray, Curve, Point2D, Point3D,
     atan2, floor, ceiling, Sum, Product, Symbol, frac, im, re, zeta, Poly,
-    Union, Interval, nsimplify, Set, Integral, hyper, fraction
+    Union, Interval, nsimplify, nfloat, Set, Integral, hyper, fraction,
+    Piecewise, Function
 )
 from sympy.core.relational import Relational
 from sympy.calculus.util import continuous_domain
@@ -209,6 +210,84 @@ def _adaptive_eval(
     return xs, ys, np.rot90(z)
 
 
+def _njit_with_fallback(numba, f):
+    """Compile a lambdified function with numba, falling back to the original
+    function if the compilation fails (not every expression produced by
+    lambdify is supported by numba in nopython mode).
+    """
+    jitted = numba.njit(cache=True)(f)
+
+    def wrapper(*args):
+        try:
+            return jitted(*args)
+        except numba.errors.NumbaError:
+            return f(*args)
+
+    return wrapper
+
+
+# Cache of lambdified callables. Sibling series often share the same
+# expression (eg the real/imag/abs/arg series created by plot_real_imag),
+# and interactive applications may rebuild identical series over and over:
+# lambdify is the dominant construction cost, and the functions it returns
+# are stateless, hence safe to share between series.
+_lambdify_cache = {}
+_LAMBDIFY_CACHE_MAXSIZE = 256
+
+
+def _cached_lambdify(signature, expr, modules=None, dummify=False, cse=False):
+    """Memoized version of ``lambdify``, used by the uniform meshing
+    strategy. Falls back to a plain ``lambdify`` call whenever the key
+    is not hashable (eg ``modules`` containing user-provided dicts).
+    """
+    try:
+        key = (
+            tuple(signature), expr,
+            modules if isinstance(modules, str) else repr(modules),
+            dummify, cse)
+        hash(key)
+    except TypeError:
+        return lambdify(
+            signature, expr, modules=modules, dummify=dummify, cse=cse)
+    f = _lambdify_cache.get(key)
+    if f is None:
+        if len(_lambdify_cache) >= _LAMBDIFY_CACHE_MAXSIZE:
+            _lambdify_cache.clear()
+        f = lambdify(
+            signature, expr, modules=modules, dummify=dummify, cse=cse)
+        _lambdify_cache[key] = f
+    return f
+
+
+# Cache of evaluation results. plot_real_imag & co. create one series per
+# requested component (real, imag, abs, arg), each evaluating the very same
+# complex function over the very same discretized domain: thanks to the
+# lambdify cache the siblings share the same callable, so the raw results
+# can be shared as well and each sibling only extracts its own component.
+_uniform_eval_cache = {}
+_UNIFORM_EVAL_CACHE_MAXSIZE = 16
+
+
+def _make_uniform_eval_key(f, args, modules):
+    """Build a hashable key identifying an evaluation: the callable plus a
+    snapshot of its arguments. Return None if the key can't be built.
+    """
+    np = import_module('numpy')
+    key = [f, modules if isinstance(modules, str) else repr(modules)]
+    try:
+        for a in args:
+            if isinstance(a, np.ndarray):
+                # hashing the raw bytes is a O(N) memcpy: much cheaper than
+                # re-evaluating a transcendental function over the array
+                key.append((a.shape, a.dtype.str, hash(a.tobytes())))
+            else:
+                hash(a)
+                key.append(a)
+    except TypeError:
+        return None
+    return tuple(key)
+
+
 def _uniform_eval(
     f1, f2, *args, modules=None, force_real_eval=False, has_sum=False
 ):
@@ -955,6 +1034,19 @@ class CommonUniformEvaluation:
             self.adaptive = False
         # represents the evaluation modules to be used by lambdify
         self.modules = kwargs.get("modules", None)
+        # if True, attempt to compile the lambdified expression with numba.
+        # The one-time compilation cost is amortized over repeated
+        # evaluations (eg interactive-widget plots)
+        self._jit = kwargs.get("jit", False)
+        # modules="numba" (eg from cfg["complex"]["modules"]) is a shortcut
+        # for the numpy evaluation compiled with numba
+        if self.modules == "numba":
+            self.modules = None
+            self._jit = True
+        # evaluate over a reduced-precision dtype (eg np.complex64): halves
+        # the memory bandwidth of the evaluation and post-processing, which
+        # is plenty of precision for rendering purposes
+        self._dtype = kwargs.get("dtype", None)
         # If True, the backend will attempt to render it on a polar-projection
         # axis, or using a polar discretization if a 3D plot is requested
         self.is_polar = kwargs.get("is_polar", False)
@@ -971,13 +1063,63 @@ class CommonUniformEvaluation:
             # Generate a list of lambda functions, two for each expression:
             # 1. the default one.
             # 2. the backup one, in case of failures with the default one.
+            numba = None
+            if self._jit and (
+                (self.modules is None) or
+                (isinstance(self.modules, str) and "numpy" in self.modules)
+            ):
+                numba = import_module('numba', warn_not_installed=True)
+
             self._functions = []
             for e in exprs:
-                # TODO: set cse=True once this issue is solved:
-                # https://github.com/sympy/sympy/issues/24246
+                if getattr(e, "is_number", False) and (not e.free_symbols):
+                    # constant expression: no need to go through lambdify,
+                    # evaluate it once and return the value from a plain
+                    # callable (the caller corrects the shape of scalar
+                    # results)
+                    try:
+                        val = complex(e)
+                        if val.imag == 0:
+                            val = val.real
+                        f = lambda *args, _v=val: _v
+                        self._functions.append([f, f])
+                        continue
+                    except (TypeError, ValueError):
+                        # eg zoo, nan: let lambdify deal with it
+                        pass
+                fe = e
+                if isinstance(e, Expr) and (
+                    (self.modules is None) or
+                    (isinstance(self.modules, str) and any(
+                        m in self.modules for m in ("numpy", "math")))
+                ) and (not e.has(Sum, Product, Integral, Piecewise, Relational)
+                ) and any(
+                    not t.free_symbols for t in e.atoms(Function)
+                ):
+                    # the expression contains constant function applications
+                    # (eg sin(1)*exp(2)): fold them to floats, so that the
+                    # generated function contains literal numbers instead of
+                    # re-evaluating them at each call. Expressions with
+                    # structure that nfloat might mangle (summation bounds,
+                    # piecewise conditions, ...) are left untouched.
+                    try:
+                        fe = nfloat(e, exponent=False)
+                    except (TypeError, ValueError, NotImplementedError):
+                        fe = e
+                # NOTE: common sub-expressions are evaluated once thanks to
+                # cse=True (https://github.com/sympy/sympy/issues/24246 has
+                # been fixed in the mean time)
+                f = _cached_lambdify(
+                    self._signature, fe, modules=self.modules, cse=True)
+                if numba is not None:
+                    # the actual compilation happens at the first evaluation.
+                    # Should numba be unable to compile the function, fall
+                    # back to the plain lambdified function
+                    f = _njit_with_fallback(numba, f)
                 self._functions.append([
-                    lambdify(self._signature, e, modules=self.modules),
-                    lambdify(self._signature, e, modules="sympy", dummify=True),
+                    f,
+                    _cached_lambdify(
+                        self._signature, e, modules="sympy", dummify=True),
                 ])
         else:
             self._signature = sorted([r[0] for r in self.ranges], key=lambda t: t.name)
@@ -1065,16 +1207,29 @@ class CommonUniformEvaluation:
         discr = [self._discretized_domain[s[0]] for s in self.ranges]
 
         args = self._aggregate_args()
+        if self._dtype is not None:
+            # cast the discretizations before the evaluation, so that the
+            # ufuncs of the lambdified function run at reduced width too
+            args = [
+                a.astype(self._dtype, copy=False)
+                if isinstance(a, np.ndarray) else a for a in args]
 
         results = []
         for f in self._functions:
-            r = _uniform_eval(*f, *args, modules=self.modules)
+            key = _make_uniform_eval_key(f[0], args, self.modules)
+            r = _uniform_eval_cache.get(key) if key is not None else None
+            if r is None:
+                r = _uniform_eval(*f, *args, modules=self.modules)
+                if key is not None:
+                    if len(_uniform_eval_cache) >= _UNIFORM_EVAL_CACHE_MAXSIZE:
+                        _uniform_eval_cache.clear()
+                    _uniform_eval_cache[key] = r
             # the evaluation might produce an int/float. Need this correction.
             r = self._correct_shape(np.array(r), discr[0])
             # sometime the evaluation is performed over arrays of type object.
             # hence, `result` might be of type object, which don't work well
             # with numpy real and imag functions.
-            r = r.astype(complex)
+            r = r.astype(complex if self._dtype is None else self._dtype)
             results.append(r)
 
         if cast_to_real:
@@ -1619,10 +1774,11 @@ class LineOver1DRangeSeries(
             except (ZeroDivisionError, OverflowError):
                 return np.nan, np.nan
 
+        start, end = complex(self.start), complex(self.end)
         data = _adaptive_eval(
             func, [self.var], self.expr,
-            [complex(self.start).real, complex(self.end).real],
-            complex(self.start).imag,
+            [start.real, end.real],
+            start.imag,
             modules=self.modules,
             adaptive_goal=self.adaptive_goal,
             loss_fn=self.loss_fn)
@@ -2187,6 +2343,12 @@ class ContourSeries(SurfaceOver2DRangeSeries):
             "contour_kw", kwargs.get("rendering_kw", dict()))
 
 
+# cache of interval-math lambdified functions used by the adaptive
+# implicit-plot algorithm, keyed on (var_x, var_y, expr)
+_interval_func_cache = {}
+_INTERVAL_FUNC_CACHE_MAXSIZE = 64
+
+
 class ImplicitSeries(
     CommonUniformEvaluation, BaseSeries
 ):
@@ -2282,20 +2444,17 @@ class ImplicitSeries(
         # or LessThan
         has_equality = False
 
-        def arg_expand(bool_expr):
-            """Recursively expands the arguments of an Boolean Function"""
-            for arg in bool_expr.args:
-                if isinstance(arg, BooleanFunction):
-                    arg_expand(arg)
-                elif isinstance(arg, Relational):
-                    arg_list.append(arg)
-
-        arg_list = []
         if isinstance(expr, BooleanFunction):
-            arg_expand(expr)
-            # Check whether there is an equality in the expression provided.
-            if any(isinstance(e, (Equality, GreaterThan, LessThan)) for e in arg_list):
-                has_equality = True
+            # walk the arguments of arbitrarily nested boolean functions
+            # with an explicit stack, stopping at the first equality found
+            stack = [expr]
+            while stack and (not has_equality):
+                for arg in stack.pop().args:
+                    if isinstance(arg, BooleanFunction):
+                        stack.append(arg)
+                    elif isinstance(arg, (Equality, GreaterThan, LessThan)):
+                        has_equality = True
+                        break
         elif not isinstance(expr, Relational):
             expr = Equality(expr, 0)
             has_equality = True
@@ -2347,18 +2506,29 @@ class ImplicitSeries(
         return self._get_meshes_grid()
 
     def _adaptive_eval(self):
-        import sympy.plotting.intervalmath.lib_interval as li
-
-        user_functions = {}
-        printer = IntervalMathPrinter({
-            'fully_qualified_modules': False, 'inline': True,
-            'allow_unknown_functions': True,
-            'user_functions': user_functions})
-
-        keys = [t for t in dir(li) if ("__" not in t) and (t not in ["import_module", "interval"])]
-        vals = [getattr(li, k) for k in keys]
-        d = {k: v for k, v in zip(keys, vals)}
-        func = lambdify((self.var_x, self.var_y), self.expr, modules=[d], printer=printer)
+        # interval-math lambdification is relatively expensive (it scans the
+        # interval library and builds a custom printer): reuse the compiled
+        # function when the same expression is plotted again
+        key = (self.var_x, self.var_y, self.expr)
+        func = _interval_func_cache.get(key)
+        if func is None:
+            import sympy.plotting.intervalmath.lib_interval as li
+
+            user_functions = {}
+            printer = IntervalMathPrinter({
+                'fully_qualified_modules': False, 'inline': True,
+                'allow_unknown_functions': True,
+                'user_functions': user_functions})
+
+            keys = [t for t in dir(li) if ("__" not in t) and (t not in ["import_module", "interval"])]
+            vals = [getattr(li, k) for k in keys]
+            d = {k: v for k, v in zip(keys, vals)}
+            if len(_interval_func_cache) >= _INTERVAL_FUNC_CACHE_MAXSIZE:
+                _interval_func_cache.clear()
+            func = lambdify(
+                (self.var_x, self.var_y), self.expr,
+                modules=[d], printer=printer)
+            _interval_func_cache[key] = func
         data = None
 
         try:
@@ -2603,6 +2773,7 @@ class ComplexPointSeries(Line2DBaseSeries):
             self.expr = expr
 
         self._block_lambda_functions(*self.expr)
+        self._cached_points = None
 
         self.is_point = kwargs.get("scatter", kwargs.get("is_point", True))
         if self.use_cm and self.color_func:
@@ -2611,8 +2782,17 @@ class ComplexPointSeries(Line2DBaseSeries):
     def _get_data_helper(self):
         """Returns coordinates that needs to be postprocessed."""
         np = import_module('numpy')
-        points = [complex(p.evalf(subs=self.params)) for p in self.expr]
-        points = np.array(points)
+        if not self.params:
+            # static points: convert them to a contiguous buffer once and
+            # reuse it on successive get_data calls
+            if self._cached_points is None:
+                self._cached_points = np.fromiter(
+                    (complex(p) for p in self.expr),
+                    dtype=np.complex128, count=len(self.expr))
+            points = self._cached_points
+        else:
+            points = np.array(
+                [complex(p.evalf(subs=self.params)) for p in self.expr])
         r, i = np.real(points), np.imag(points)
         if self.use_cm and callable(self.color_func):
             return r, i, self.eval_color_func(r, i)
@@ -2822,14 +3002,24 @@ class ComplexDomainColoringSeries(
     def _create_discretized_domain(self):
         return ComplexSurfaceBaseSeries._create_discretized_domain(self)
 
-    def _domain_coloring(self, domain, w):
+    def _domain_coloring(self, domain, w, mag=None, arg=None):
         if isinstance(self.coloring, str):
+            np = import_module('numpy')
             self.coloring = self.coloring.lower()
+            # the coloring functions output 8-bit colors: single precision
+            # is plenty, and it halves the memory traffic of the several
+            # full-grid passes they perform
+            w = w.astype(np.complex64, copy=False)
+            if mag is not None:
+                mag = mag.astype(np.float32, copy=False)
+            if arg is not None:
+                arg = arg.astype(np.float32, copy=False)
             return wegert(
                 self.coloring, w, self.phaseres, self.cmap,
                 self.blevel, self.phaseoffset,
                 self.at_infinity, self.riemann_mask,
-                domain=[domain[0, 0], domain[-1, -1]])
+                domain=[domain[0, 0], domain[-1, -1]],
+                mag=mag, arg=arg)
         return self.coloring(w)
 
     def get_data(self):
@@ -2860,10 +3050,14 @@ class ComplexDomainColoringSeries(
         np = import_module('numpy')
 
         domain, z = self._evaluate(False)
+        # compute magnitude and argument once, from the separate real and
+        # imaginary planes, and share them with the coloring functions
+        re_z, im_z = z.real, z.imag
+        mag, arg = np.hypot(re_z, im_z), np.arctan2(im_z, re_z)
         return self._apply_transform(
             np.real(domain), np.imag(domain),
-            np.absolute(z), np.angle(z),
-            *self._domain_coloring(domain, z),
+            mag, arg,
+            *self._domain_coloring(domain, z, mag, arg),
         )
 
 
@@ -2924,52 +3118,45 @@ def _set_discretization_points(kwargs, pt):
 
     kwargs : dict
     """
-    deprecated_keywords = {
-        "nb_of_points": "n",
-        "nb_of_points_x": "n1",
-        "nb_of_points_y": "n2",
-        "nb_of_points_u": "n1",
-        "nb_of_points_v": "n2",
-        "points": "n"
-    }
-    for k, v in deprecated_keywords.items():
+    for k, v in _deprecated_discretization_keywords.items():
         if k in kwargs.keys():
             kwargs[v] = kwargs.pop(k)
 
-    if pt in [
-        LineOver1DRangeSeries, Parametric2DLineSeries,
-        Parametric3DLineSeries, AbsArgLineSeries, ColoredLineOver1DRangeSeries,
-        ComplexParametric3DLineSeries, NyquistLineSeries, NicholsLineSeries,
-        SystemResponseSeries, ColoredSystemResponseSeries
-    ]:
-        if "n" in kwargs.keys():
-            kwargs["n1"] = kwargs["n"]
-            if hasattr(kwargs["n"], "__iter__") and (len(kwargs["n"]) > 0):
-                kwargs["n1"] = kwargs["n"][0]
-    elif pt in [
-        SurfaceOver2DRangeSeries, ContourSeries, ParametricSurfaceSeries,
-        ComplexSurfaceSeries, ComplexDomainColoringSeries,
-        Vector2DSeries, ImplicitSeries, RiemannSphereSeries
-    ]:
-        if "n" in kwargs.keys():
-            if hasattr(kwargs["n"], "__iter__") and (len(kwargs["n"]) > 1):
-                kwargs["n1"] = kwargs["n"][0]
-                kwargs["n2"] = kwargs["n"][1]
-            else:
-                kwargs["n1"] = kwargs["n2"] = kwargs["n"]
-    elif pt in [
-        Vector3DSeries, SliceVector3DSeries, Implicit3DSeries, PlaneSeries
-    ]:
-        if "n" in kwargs.keys():
-            if hasattr(kwargs["n"], "__iter__") and (len(kwargs["n"]) > 2):
-                kwargs["n1"] = kwargs["n"][0]
-                kwargs["n2"] = kwargs["n"][1]
-                kwargs["n3"] = kwargs["n"][2]
-            else:
-                kwargs["n1"] = kwargs["n2"] = kwargs["n3"] = kwargs["n"]
+    if "n" not in kwargs.keys():
+        # this function runs on every series construction: skip the type
+        # dispatch when there is nothing to expand
+        return kwargs
+
+    if pt in _1d_discretization_series:
+        kwargs["n1"] = kwargs["n"]
+        if hasattr(kwargs["n"], "__iter__") and (len(kwargs["n"]) > 0):
+            kwargs["n1"] = kwargs["n"][0]
+    elif pt in _2d_discretization_series:
+        if hasattr(kwargs["n"], "__iter__") and (len(kwargs["n"]) > 1):
+            kwargs["n1"] = kwargs["n"][0]
+            kwargs["n2"] = kwargs["n"][1]
+        else:
+            kwargs["n1"] = kwargs["n2"] = kwargs["n"]
+    elif pt in _3d_discretization_series:
+        if hasattr(kwargs["n"], "__iter__") and (len(kwargs["n"]) > 2):
+            kwargs["n1"] = kwargs["n"][0]
+            kwargs["n2"] = kwargs["n"][1]
+            kwargs["n3"] = kwargs["n"][2]
+        else:
+            kwargs["n1"] = kwargs["n2"] = kwargs["n3"] = kwargs["n"]
     return kwargs
 
 
+_deprecated_discretization_keywords = {
+    "nb_of_points": "n",
+    "nb_of_points_x": "n1",
+    "nb_of_points_y": "n2",
+    "nb_of_points_u": "n1",
+    "nb_of_points_v": "n2",
+    "points": "n"
+}
+
+
 class VectorBase(CommonUniformEvaluation, BaseSeries):
     """Represent a vector field."""
 
@@ -4396,17 +4583,19 @@ class NyquistLineSeries(ArrowsMixin, ControlBaseSeries):
         max_curve_magnitude = self.max_curve_magnitude
         max_curve_offset = self.max_curve_offset
 
-        reg_mask = np.logical_or(
-            np.abs(resp) > max_curve_magnitude,
-            splane_contour.real != 0)
+        # compare squared magnitudes: the threshold test doesn't need the
+        # square root, and the mask is used twice below
+        mag_mask = (
+            resp.real * resp.real + resp.imag * resp.imag
+            > max_curve_magnitude * max_curve_magnitude)
+        reg_mask = np.logical_or(mag_mask, splane_contour.real != 0)
 
         scale_mask = ~reg_mask \
             & np.concatenate((~reg_mask[1:], ~reg_mask[-1:])) \
             & np.concatenate((~reg_mask[0:1], ~reg_mask[:-1]))
 
         # Rescale the points with large magnitude
-        rescale = np.logical_and(
-            reg_mask, abs(resp) > max_curve_magnitude)
+        rescale = np.logical_and(reg_mask, mag_mask)
         resp[rescale] *= max_curve_magnitude / abs(resp[rescale])
 
         # Plot the regular portions of the curve (and grab the color)
@@ -4980,3 +5169,22 @@ class MCirclesSeries(GridBase, BaseSeries):
                 y = [0]
             data.append([mdb, x, y])
         return data
+
+
+# series types grouped by the number of discretization directions, used by
+# _set_discretization_points to expand the `n` keyword. Defined here because
+# the classes must exist when these sets are built.
+_1d_discretization_series = frozenset([
+    LineOver1DRangeSeries, Parametric2DLineSeries,
+    Parametric3DLineSeries, AbsArgLineSeries, ColoredLineOver1DRangeSeries,
+    ComplexParametric3DLineSeries, NyquistLineSeries, NicholsLineSeries,
+    SystemResponseSeries, ColoredSystemResponseSeries
+])
+_2d_discretization_series = frozenset([
+    SurfaceOver2DRangeSeries, ContourSeries, ParametricSurfaceSeries,
+    ComplexSurfaceSeries, ComplexDomainColoringSeries,
+    Vector2DSeries, ImplicitSeries, RiemannSphereSeries
+])
+_3d_discretization_series = frozenset([
+    Vector3DSeries, SliceVector3DSeries, Implicit3DSeries, PlaneSeries
+])
@@ -9,10 +9,30 @@ from sympy.core.function import AppliedUndef
 from sympy.core.relational import Relational
 from sympy.logic.boolalg import BooleanFunction
 from sympy.external import import_module
+from itertools import chain
 import warnings
 import inspect
 
 
+# maps (min, max, imaginary) to sympified default-range bounds: the values
+# come from the configuration, so only a handful of keys ever exist, but
+# without the cache every missing range re-sympifies the same numbers
+_default_range_bounds = {}
+
+
+def _get_default_range_bounds(_min, _max, imaginary):
+    key = (_min, _max, imaginary)
+    bounds = _default_range_bounds.get(key)
+    if bounds is None:
+        if not imaginary:
+            bounds = (sympify(_min), sympify(_max))
+        else:
+            bounds = (
+                sympify(_min + _min * 1j), sympify(_max + _max * 1j))
+        _default_range_bounds[key] = bounds
+    return bounds
+
+
 def _create_missing_ranges(exprs, ranges, npar, params=None, imaginary=False):
     """This function does two things:
     1. Check if the number of free symbols is in agreement with the type of
@@ -42,9 +62,8 @@ def _create_missing_ranges(exprs, ranges, npar, params=None, imaginary=False):
     def get_default_range(symbol):
         _min = cfg["plot_range"]["min"]
         _max = cfg["plot_range"]["max"]
-        if not imaginary:
-            return Tuple(symbol, _min, _max)
-        return Tuple(symbol, _min + _min * 1j, _max + _max * 1j)
+        start, end = _get_default_range_bounds(_min, _max, imaginary)
+        return Tuple(symbol, start, end, sympify=False)
 
     free_symbols = _get_free_symbols(exprs)
     if params is not None:
@@ -72,7 +91,7 @@ def _create_missing_ranges(exprs, ranges, npar, params=None, imaginary=False):
             "Too many ranges. Received %s, expected %s" % (len(ranges), npar))
 
     # free symbols in the ranges provided by the user
-    rfs = set().union([r[0] for r in ranges])
+    rfs = {r[0] for r in ranges}
     if len(rfs) != len(ranges):
         raise ValueError("Multiple ranges with the same symbol")
 
@@ -90,7 +109,7 @@ def _create_missing_ranges(exprs, ranges, npar, params=None, imaginary=False):
         # there could be times when this condition is not met, for example
         # plotting the function f(x, y) = x (which is a plane); in this case,
         # free_symbols = {x} whereas rfs = {x, y} (or x and Dummy)
-        rfs = set().union([r[0] for r in ranges])
+        rfs = {r[0] for r in ranges}
         if len(free_symbols.difference(rfs)) > 0:
             raise ValueError(
                 "Incompatible free symbols of the expressions with "
@@ -170,11 +189,11 @@ def _get_free_symbols(exprs):
     if all(callable(e) for e in exprs):
         return set()
 
-    free = set().union(*[e.atoms(Indexed) for e in exprs])
-    free = free.union(*[e.atoms(AppliedUndef) for e in exprs])
+    free = set(chain.from_iterable(e.atoms(Indexed) for e in exprs))
+    free.update(chain.from_iterable(e.atoms(AppliedUndef) for e in exprs))
     if len(free) > 0:
         return free
-    return set().union(*[e.free_symbols for e in exprs])
+    return set(chain.from_iterable(e.free_symbols for e in exprs))
 
 
 def _check_arguments(args, nexpr, npar, **kwargs):
@@ -230,7 +249,7 @@ def _check_arguments(args, nexpr, npar, **kwargs):
         #   2. multiple expressions over the same range
 
         exprs, ranges, label, rendering_kw = _unpack_args(*args)
-        free_symbols = set().union(*[e.free_symbols for e in exprs])
+        free_symbols = set(chain.from_iterable(e.free_symbols for e in exprs))
         ranges = _create_missing_ranges(exprs, ranges, npar, params)
 
         if nexpr > 1:
@@ -253,12 +272,14 @@ def _check_arguments(args, nexpr, npar, **kwargs):
         _, ranges, labels, rendering_kw = _unpack_args(*args)
         labels = [labels] if labels else []
 
-        # number of expressions
-        n = (
-            len(ranges) + len(labels) +
-            (len(rendering_kw) if rendering_kw is not None else 0)
-        )
-        new_args = args[:-n] if n > 0 else args
+        # the global ranges/labels/rendering keywords live at the top level
+        # of args (the local ones are nested inside each expression tuple):
+        # filter them out with a single pass instead of counting them and
+        # slicing them off the tail
+        new_args = [
+            a for a in args
+            if not (isinstance(a, (str, dict)) or _is_range(a))
+        ]
 
         # at this point, new_args might just be [expr]. But I need it to be
         # [[expr]] in order to be able to loop over
@@ -284,8 +305,8 @@ def _check_arguments(args, nexpr, npar, **kwargs):
             arg = [arg[i] for i in range(nexpr)]
             free_symbols = set()
             if all(not callable(a) for a in arg):
-                free_symbols = free_symbols.union(*[
-                    a.free_symbols for a in arg])
+                free_symbols = set(chain.from_iterable(
+                    a.free_symbols for a in arg))
             if len(r) != npar:
                 r = _create_missing_ranges(arg, r, npar, params)
 
@@ -310,7 +331,9 @@ def _plot_sympify(args):
         if isinstance(a, (list, tuple)):
             args[i] = Tuple(*_plot_sympify(a), sympify=False)
         elif not (
-            isinstance(a, (str, dict)) or callable(a)
+            # objects already in sympified form don't need to go through
+            # sympify again
+            isinstance(a, (str, dict, Basic)) or callable(a)
             or (
                 (a.__class__.__name__ == "Vector") and
                 not isinstance(a, Basic)
@@ -326,11 +349,14 @@ def _is_range(r):
     """
     if isinstance(r, prange):
         return True
+    # cheap structural checks first: the is_number queries walk the
+    # expressions, so only reach them for actual 3-elements Tuples
+    if not (isinstance(r, Tuple) and (len(r) == 3)):
+        return False
+    _, start, end = r.args
     return (
-        isinstance(r, Tuple)
-        and (len(r) == 3)
-        and (not isinstance(r.args[1], str)) and r.args[1].is_number
-        and (not isinstance(r.args[2], str)) and r.args[2].is_number
+        (not isinstance(start, str)) and start.is_number
+        and (not isinstance(end, str)) and end.is_number
     )
 
 
@@ -394,6 +420,26 @@ class prange(Tuple):
         return Tuple.__new__(cls, *args, sympify=False)
 
 
+_unpack_args_cache = {}
+_UNPACK_ARGS_CACHE_MAXSIZE = 128
+
+
+def _unpack_args_key(args):
+    """Build a hashable cache key for ``_unpack_args``. Rendering keywords
+    are dictionaries, hence unhashable: hash their sorted items instead.
+    Returns None if some argument can't be hashed.
+    """
+    try:
+        key = tuple(
+            (dict, tuple(sorted(a.items(), key=repr)))
+            if isinstance(a, dict) else a for a in args
+        )
+        hash(key)
+        return key
+    except TypeError:
+        return None
+
+
 def _unpack_args(*args):
     """Given a list/tuple of arguments previously processed by _plot_sympify()
     and/or _check_arguments(), separates and returns its components:
@@ -419,18 +465,42 @@ def _unpack_args(*args):
     >>> _unpack_args(*args)
         ([sin(x + y), cos(x - y), x + y], [(x, -2, 2), (y, -3, 3)], 'f3')
     """
-    ranges = [t for t in args if _is_range(t)]
-    labels = [t for t in args if isinstance(t, str)]
-    label = None if not labels else labels[0]
-    rendering_kw = [t for t in args if isinstance(t, dict)]
-    rendering_kw = None if not rendering_kw else rendering_kw[0]
-    # NOTE: why None? because args might have been preprocessed by
-    # _check_arguments, so None might represent the rendering_kw
-    results = [
-        not (_is_range(a) or isinstance(a, (str, dict)) or (a is None))
-        for a in args
-    ]
-    exprs = [a for a, b in zip(args, results) if b]
+    # plot functions may call this helper multiple times with the same
+    # arguments: cache the classification. Callers are free to mutate the
+    # returned lists/dict, so cache hits return shallow copies.
+    key = _unpack_args_key(args)
+    if key is not None:
+        cached = _unpack_args_cache.get(key)
+        if cached is not None:
+            exprs, ranges, label, rendering_kw = cached
+            return (
+                list(exprs), list(ranges), label,
+                None if rendering_kw is None else dict(rendering_kw)
+            )
+
+    # classify each argument with a single pass
+    exprs, ranges, label, rendering_kw = [], [], None, None
+    for a in args:
+        if isinstance(a, str):
+            if label is None:
+                label = a
+        elif isinstance(a, dict):
+            if rendering_kw is None:
+                rendering_kw = a
+        elif _is_range(a):
+            ranges.append(a)
+        elif a is not None:
+            # NOTE: why None? because args might have been preprocessed by
+            # _check_arguments, so None might represent the rendering_kw
+            exprs.append(a)
+
+    if key is not None:
+        if len(_unpack_args_cache) >= _UNPACK_ARGS_CACHE_MAXSIZE:
+            _unpack_args_cache.clear()
+        _unpack_args_cache[key] = (
+            list(exprs), list(ranges), label,
+            None if rendering_kw is None else dict(rendering_kw)
+        )
     return exprs, ranges, label, rendering_kw
 
 
@@ -453,19 +523,15 @@ def get_vertices_indices(x, y, z):
     np = import_module('numpy')
 
     rows, cols = x.shape
-    x = x.flatten()
-    y = y.flatten()
-    z = z.flatten()
-    vertices = np.vstack([x, y, z]).T
-    indices = []
-    for i in range(1, rows):
-        for j in range(1, cols):
-            indices.append(
-                [ij2k(cols, i, j), ij2k(cols, i - 1, j), ij2k(cols, i, j - 1)]
-            )
-            indices.append(
-                [ij2k(cols, i - 1, j - 1), ij2k(cols, i, j - 1), ij2k(cols, i - 1, j)]
-            )
+    vertices = np.column_stack([x.flatten(), y.flatten(), z.flatten()])
+    # vectorized connectivity: k is the flattened index of the vertex at
+    # (i, j), for i in [1, rows) and j in [1, cols). Each (i, j) produces
+    # two triangles; interleave them to preserve the face ordering of the
+    # original double loop.
+    k = cols * np.arange(1, rows)[:, np.newaxis] + np.arange(1, cols)
+    tri1 = np.dstack([k, k - cols, k - 1])
+    tri2 = np.dstack([k - cols - 1, k - 1, k - cols])
+    indices = np.stack([tri1, tri2], axis=2).reshape(-1, 3)
     return vertices, indices
 
 
@@ -535,7 +601,7 @@ def _validate_kwargs(backend_obj, **kwargs):
     # processed by other functions before instantion of Series and Backend.
     allowed_keys = allowed_keys.union([
         "abs", "absarg", "arg", "real", "imag", "force_real_eval",
-        "slice", "threed", "sum_bound", "n",
+        "slice", "threed", "sum_bound", "n", "jit", "dtype",
         "phaseres", "is_point", "is_polar", "label",
         "wireframe", "wf_n1", "wf_n2", "wf_npoints", "wf_rendering_kw",
         "dots", "show_in_legend", "fig", "ax",
@@ -14,6 +14,94 @@ under BSD 3 clauses.
 import matplotlib
 import numpy as np
 import warnings
+from sympy.external import import_module
+
+
+# numba-compiled HSV->RGB kernel, built on first use. False means numba is
+# not available and the matplotlib conversion should be used instead.
+_hsv_kernel = None
+
+
+def _get_hsv_kernel():
+    """Build (once) a compiled kernel converting hue/value planes (fully
+    saturated colors) to an RGB image in a single pass over the grid,
+    instead of the several full-grid passes performed by matplotlib's
+    ``hsv_to_rgb``. Returns None when numba is not installed.
+    """
+    global _hsv_kernel
+    if _hsv_kernel is False:
+        return None
+    if _hsv_kernel is None:
+        numba = import_module('numba')
+        if numba is None:
+            _hsv_kernel = False
+            return None
+
+        @numba.njit(parallel=True, fastmath=True, cache=True)
+        def kernel(H, V, out):
+            n, m = H.shape
+            for i in numba.prange(n):
+                for j in range(m):
+                    h = H[i, j] * 6.0
+                    v = V[i, j]
+                    k = int(h) % 6
+                    f = h - int(h)
+                    q = v * (1.0 - f)
+                    t = v * f
+                    if k == 0:
+                        r, g, b = v, t, 0.0
+                    elif k == 1:
+                        r, g, b = q, v, 0.0
+                    elif k == 2:
+                        r, g, b = 0.0, v, t
+                    elif k == 3:
+                        r, g, b = 0.0, q, v
+                    elif k == 4:
+                        r, g, b = t, 0.0, v
+                    else:
+                        r, g, b = v, 0.0, q
+                    out[i, j, 0] = r
+                    out[i, j, 1] = g
+                    out[i, j, 2] = b
+
+        _hsv_kernel = kernel
+    return _hsv_kernel
+
+
+# precomputed hue->RGB lookup table (saturation=value=1), built on first use
+_HUE_LUT = None
+_HUE_LUT_N = 1024
+
+
+def _get_hue_lut():
+    global _HUE_LUT
+    if _HUE_LUT is None:
+        h = np.linspace(0, 1, _HUE_LUT_N, endpoint=False)
+        ones = np.ones_like(h)
+        _HUE_LUT = matplotlib.colors.hsv_to_rgb(np.dstack([h, ones, ones]))[0]
+    return _HUE_LUT
+
+
+def _hsv_to_rgb(H, V=None):
+    """Convert hue and value planes (saturation=1) to an RGB image, using
+    the fused numba kernel when available.
+    """
+    kernel = _get_hsv_kernel()
+    if (kernel is not None) and (H.ndim == 2):
+        if V is None:
+            V = np.ones_like(H)
+        out = np.empty(H.shape + (3,))
+        kernel(H, V, out)
+        return out
+    # without numba, quantize the hue to a precomputed 1024-color table:
+    # a single gather replaces the piecewise branching of hsv_to_rgb, and
+    # with saturation=1 every RGB component scales linearly with the value
+    # plane, so the brightness can be applied as a plain multiplication
+    idx = (H * _HUE_LUT_N).astype(np.int32) % _HUE_LUT_N
+    rgb = _get_hue_lut()[idx]
+    if V is not None:
+        rgb = rgb * V[..., np.newaxis]
+    return rgb
 
 
 def to_rgb_255(func):
@@ -28,13 +116,21 @@ def to_rgb_255(func):
 
 def rect_func(x, dx):
     """Create rectangular impulses of length dx."""
-    return np.mod(np.floor(x / dx), 2)
+    x = np.floor(x / dx)
+    x %= 2
+    return x
 
 
 def saw_func(x, dx, a, b):
     """Saw tooth function on R with period dx onto [a,b]"""
-    x = x / dx - np.floor(x / dx)
-    return a + (b - a) * x
+    x = x / dx
+    x -= np.floor(x)
+    if (a == 0) and (b == 1):
+        # common case: skip the rescaling passes over the grid
+        return x
+    x *= b - a
+    x += a
+    return x
 
 
 def disk_mask(center, radius, shape):
@@ -54,6 +150,20 @@ def disk_mask(center, radius, shape):
     return x**2 + y**2 <= radius**2
 
 
+def _get_mag(w, kwargs):
+    """Return the magnitude precomputed by the caller, if available: the
+    series usually computed it already for its own data."""
+    mag = kwargs.get("mag")
+    return mag if mag is not None else np.absolute(w)
+
+
+def _get_arg(w, kwargs):
+    """Return the argument precomputed by the caller, if available: the
+    series usually computed it already for its own data."""
+    arg = kwargs.get("arg")
+    return arg if arg is not None else np.angle(w)
+
+
 def _apply_enhancement(mag, rgb):
     """Alpha blending between RGB image with a white image using the inverse
     of the brightness mask: zeros will retain colors, poles go white.
@@ -114,22 +224,29 @@ def _apply_riemann_mask(lower_left, upper_right, rgb):
     return np.maximum(rgb, layer) * opacity + rgb * (1 - opacity)
 
 
+def _bw_image(plane):
+    """Quantize a single [0, 1] plane to 8 bit and stack it into a grayscale
+    RGB image: the three-fold replication then moves uint8 bytes instead of
+    float64, and the conversion pass of ``to_rgb_255`` is avoided.
+    """
+    plane = np.multiply(plane, 255).astype(np.uint8)
+    return np.dstack([plane, plane, plane])
+
+
 @to_rgb_255
 def domain_coloring(w, phaseres=20, cmap=None, poffset=0, **kwargs):
     """Standard domain coloring."""
-    arg = np.angle(w)
+    arg = _get_arg(w, kwargs)
     # normalize the argument to [0, 1]
     arg = (arg / (2 * np.pi) + poffset) % 1
 
     if (cmap is None) or (cmap == matplotlib.cm.hsv):
-        H = arg
-        S = V = np.ones_like(H)
-        rgb = matplotlib.colors.hsv_to_rgb(np.dstack([H, S, V]))
+        rgb = _hsv_to_rgb(arg)
     else:
         rgb = cmap(arg)[:, :, :-1]
 
     if kwargs.get("enhance", False):
-        rgb = _apply_enhancement(np.absolute(w), rgb)
+        rgb = _apply_enhancement(_get_mag(w, kwargs), rgb)
     if kwargs.get("riemann_mask", False):
         domain = kwargs.get("domain")
         rgb = _apply_riemann_mask(*domain, rgb)
@@ -143,7 +260,7 @@ def enhanced_domain_coloring(
     """Enhanced domain coloring showing iso-lines for magnitude and phase,
     with an optional enhacement to wash poles to white.
     """
-    mag, arg = np.absolute(w), np.angle(w)
+    mag, arg = _get_mag(w, kwargs), _get_arg(w, kwargs)
     # normalize the argument to [0, 1]
     arg = (arg / (2 * np.pi) + poffset) % 1
     blackm = saw_func(np.log(mag), 2 * np.pi / phaseres, blevel, 1)
@@ -152,9 +269,7 @@ def enhanced_domain_coloring(
 
     if (cmap is None) or (cmap == matplotlib.cm.hsv):
         # NOTE: work on HSV space in order to eliminate "fringing"
-        H = arg
-        S, V = np.ones_like(arg), black
-        rgb = matplotlib.colors.hsv_to_rgb(np.dstack([H, S, V]))
+        rgb = _hsv_to_rgb(arg, black)
     else:
         black = np.dstack([black, black, black])
         rgb = cmap(arg)[:, :, :-1] * black
@@ -174,15 +289,14 @@ def enhanced_domain_coloring_phase(
     """Enhanced domain coloring showing iso-lines for phase,
     with an optional enhacement to wash poles to white.
     """
-    mag, arg = np.absolute(w), np.angle(w)
+    mag, arg = _get_mag(w, kwargs), _get_arg(w, kwargs)
     # normalize the argument to [0, 1]
     arg = (arg / (2 * np.pi) + poffset) % 1
     blackp = saw_func(arg, 1 / phaseres, blevel, 1)
 
     if (cmap is None) or (cmap == matplotlib.cm.hsv):
         # NOTE: work on HSV space in order to eliminate "fringing"
-        H, S, V = arg, np.ones_like(arg), blackp
-        rgb = matplotlib.colors.hsv_to_rgb(np.dstack([H, S, V]))
+        rgb = _hsv_to_rgb(arg, blackp)
     else:
         black = np.dstack([blackp, blackp, blackp])
         colors = cmap(arg)[:, :, :-1]
@@ -203,15 +317,14 @@ def enhanced_domain_coloring_mag(
     """Enhanced domain coloring showing iso-lines for magnitude,
     with an optional enhacement to wash poles to white.
     """
-    mag, arg = np.absolute(w), np.angle(w)
+    mag, arg = _get_mag(w, kwargs), _get_arg(w, kwargs)
     # normalize the argument to [0, 1]
     arg = (arg / (2 * np.pi) + poffset) % 1
     blackm = saw_func(np.log(mag), 2 * np.pi / phaseres, blevel, 1)
 
     if (cmap is None) or (cmap == matplotlib.cm.hsv):
         # NOTE: work on HSV space in order to eliminate "fringing"
-        H, S, V = arg, np.ones_like(arg), blackm
-        rgb = matplotlib.colors.hsv_to_rgb(np.dstack([H, S, V]))
+        rgb = _hsv_to_rgb(arg, blackm)
     else:
         black = np.dstack([blackm, blackm, blackm])
         colors = cmap(arg)[:, :, :-1]
@@ -225,39 +338,39 @@ def enhanced_domain_coloring_mag(
     return rgb
 
 
-@to_rgb_255
 def bw_magnitude(w, **kwargs):
     """Black and white magnitude: black are the zeros, white are the poles."""
-    mag = np.absolute(w)
+    mag = _get_mag(w, kwargs)
     if kwargs.get("apply_log", False):
         mag = np.log10(mag)
     brightness = mag / (mag + 1)
-    return np.dstack([brightness, brightness, brightness])
+    return _bw_image(brightness)
 
 
-@to_rgb_255
 def bw_stripes_phase(w, phaseres=20, **kwargs):
     """Alternating black and white stripes corresponding to phase."""
-    arg = np.angle(w)
+    arg = _get_arg(w, kwargs)
     # normalize the argument to [0, 1]
     arg = (arg / (2 * np.pi)) % 1
     black = saw_func(arg, 1 / phaseres, 0, 1)
     bmin, bmax = black.min(), black.max()
-    black = np.floor(2 * (black - bmin) / (bmax - bmin))
-    return np.dstack([black, black, black])
+    black -= bmin
+    black *= 2 / (bmax - bmin)
+    np.floor(black, out=black)
+    return _bw_image(black)
 
 
-@to_rgb_255
 def bw_stripes_mag(w, phaseres=20, **kwargs):
     """Alternating black and white stripes corresponding to modulus."""
-    mag = np.absolute(w)
+    mag = _get_mag(w, kwargs)
     black = saw_func(np.log(mag), 2 * np.pi / phaseres, 0, 1)
     bmin, bmax = black.min(), black.max()
-    black = np.floor(2 * (black - bmin) / (bmax - bmin))
-    return np.dstack([black, black, black])
+    black -= bmin
+    black *= 2 / (bmax - bmin)
+    np.floor(black, out=black)
+    return _bw_image(black)
 
 
-@to_rgb_255
 def bw_stripes_imag(w, phaseres=20, **kwargs):
     """Alternating black and white stripes corresponding to imaginary part.
     In particular recommended for stream lines of potential flow.
@@ -265,11 +378,12 @@ def bw_stripes_imag(w, phaseres=20, **kwargs):
     imres = 10 / phaseres
     black = saw_func(np.imag(w), imres, 0, 1)
     bmin, bmax = black.min(), black.max()
-    black = np.floor(2 * (black - bmin) / (bmax - bmin))
-    return np.dstack([black, black, black])
+    black -= bmin
+    black *= 2 / (bmax - bmin)
+    np.floor(black, out=black)
+    return _bw_image(black)
 
 
-@to_rgb_255
 def bw_stripes_real(w, phaseres=20, **kwargs):
     """Alternating black and white stripes corresponding to real part.
     In particular recommended for stream lines of potential flow.
@@ -277,11 +391,12 @@ def bw_stripes_real(w, phaseres=20, **kwargs):
     reres = 10 / phaseres
     black = saw_func(np.real(w), reres, 0, 1)
     bmin, bmax = black.min(), black.max()
-    black = np.floor(2 * (black - bmin) / (bmax - bmin))
-    return np.dstack([black, black, black])
+    black -= bmin
+    black *= 2 / (bmax - bmin)
+    np.floor(black, out=black)
+    return _bw_image(black)
 
 
-@to_rgb_255
 def cartesian_chessboard(w, phaseres=20, **kwargs):
     """Cartesian Chessboard on the complex points space. The result will hide
     zeros.
@@ -289,22 +404,21 @@ def cartesian_chessboard(w, phaseres=20, **kwargs):
     blackx = rect_func(np.real(w), 4 / phaseres)
     blacky = rect_func(np.imag(w), 4 / phaseres)
     white = np.mod(blackx + blacky, 2)
-    return np.dstack([white, white, white])
+    return _bw_image(white)
 
 
-@to_rgb_255
 def polar_chessboard(w, phaseres=20, **kwargs):
     """Polar Chessboard on the complex points space. The result will show
     conformality.
     """
-    mag, arg = np.absolute(w), np.angle(w)
+    mag, arg = _get_mag(w, kwargs), _get_arg(w, kwargs)
     # normalize the argument to [0, 1]
     arg = (arg / (2 * np.pi)) % 1
 
     blackp = rect_func(arg, 1 / phaseres)
     blackm = rect_func(np.log(mag), 2 * np.pi / phaseres)
     black = np.mod(blackp + blackm, 2)
-    return np.dstack([black, black, black])
+    return _bw_image(black)
 
 
 @to_rgb_255
@@ -341,7 +455,8 @@ def create_colorscale(cmap, poffset=0, N=256):
 
 def wegert(
     coloring, w, phaseres=20, cmap="hsv_r", blevel=0.75, poffset=0,
-    at_infinity=False, riemann_mask=False, N=256, domain=None
+    at_infinity=False, riemann_mask=False, N=256, domain=None,
+    mag=None, arg=None
 ):
     """ Choose between different domain coloring options.
 
@@ -390,6 +505,11 @@ def wegert(
     phaseres : int
         Number of constant-phase lines.
 
+    mag, arg : ndarray [n x m], optional
+        Precomputed magnitude and argument of ``w``. If the caller already
+        computed them, the coloring functions avoid a second pass over the
+        complex array.
+
     N : int
         Number of discretized color in the colorscale. Default to 256.
 
@@ -451,7 +571,8 @@ def wegert(
 
     kwargs = dict(
         phaseres=phaseres, cmap=cmap, blevel=blevel, poffset=poffset,
-        at_infinity=at_infinity, riemann_mask=riemann_mask)
+        at_infinity=at_infinity, riemann_mask=riemann_mask,
+        mag=mag, arg=arg)
     if coloring in ["l", "m", "n", "o"]:
         kwargs["enhance"] = True
     if coloring == "k+log":
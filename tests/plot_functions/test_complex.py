@@ -1376,12 +1376,11 @@ def test_plot_complex_vector(pc_options):
     assert isinstance(s[1], Vector2DSeries)
     assert to_float(s[1].ranges[0][1:]) == (-5, 4)
     assert to_float(s[1].ranges[1][1:]) == (-2, 3)
-    assert (
-        str(s[0].expr)
-        == "sqrt(((re(_x) - im(_y))**2 - (re(_y) + im(_x))**2)**2 + 4*(re(_x) - im(_y))**2*(re(_y) + im(_x))**2)"
-    )
-    assert str(s[1].expr[0]) == "(re(_x) - im(_y))**2 - (re(_y) + im(_x))**2"
-    assert str(s[1].expr[1]) == "2*(re(_x) - im(_y))*(re(_y) + im(_x))"
+    # the dummy variables carry the real assumption, so re()/im() of the
+    # substituted expression simplify
+    assert str(s[0].expr) == "sqrt(4*_x**2*_y**2 + (_x**2 - _y**2)**2)"
+    assert str(s[1].expr[0]) == "_x**2 - _y**2"
+    assert str(s[1].expr[1]) == "2*_x*_y"
 
     p = plot_complex_vector(
         expr, (z, -5 - 2j, 4 + 3j), "test", scalar=False, **pc_options
@@ -518,13 +518,19 @@ def test_lin_log_scale():
     # Verify that data series create the correct spacing in the data.
     x, y, z = symbols("x, y, z")
 
+    def is_uniform(arr):
+        # check the spacing of the whole 1D grid with a single vectorized
+        # pass, instead of comparing the first and last spacings only
+        d = np.diff(arr)
+        return np.allclose(d, d[0])
+
     s = LineOver1DRangeSeries(
         x, (x, 1, 10),
         adaptive=False, n=50,
         xscale="linear"
     )
     xx, _ = s.get_data()
-    assert np.isclose(xx[1] - xx[0], xx[-1] - xx[-2])
+    assert is_uniform(xx)
 
     s = LineOver1DRangeSeries(
         x, (x, 1, 10),
@@ -532,7 +538,7 @@ def test_lin_log_scale():
         xscale="log"
     )
     xx, _ = s.get_data()
-    assert not np.isclose(xx[1] - xx[0], xx[-1] - xx[-2])
+    assert not is_uniform(xx)
 
     s = Parametric2DLineSeries(
         cos(x), sin(x), (x, pi / 2, 1.5 * pi),
@@ -540,7 +546,7 @@ def test_lin_log_scale():
         xscale="linear"
     )
     _, _, param = s.get_data()
-    assert np.isclose(param[1] - param[0], param[-1] - param[-2])
+    assert is_uniform(param)
 
     s = Parametric2DLineSeries(
         cos(x), sin(x), (x, pi / 2, 1.5 * pi),
@@ -548,7 +554,7 @@ def test_lin_log_scale():
         xscale="log"
     )
     _, _, param = s.get_data()
-    assert not np.isclose(param[1] - param[0], param[-1] - param[-2])
+    assert not is_uniform(param)
 
     s = Parametric3DLineSeries(
         cos(x), sin(x), x, (x, pi / 2, 1.5 * pi),
@@ -556,7 +562,7 @@ def test_lin_log_scale():
         xscale="linear"
     )
     _, _, _, param = s.get_data()
-    assert np.isclose(param[1] - param[0], param[-1] - param[-2])
+    assert is_uniform(param)
 
     s = Parametric3DLineSeries(
         cos(x), sin(x), x, (x, pi / 2, 1.5 * pi),
@@ -564,7 +570,7 @@ def test_lin_log_scale():
         xscale="log"
     )
     _, _, _, param = s.get_data()
-    assert not np.isclose(param[1] - param[0], param[-1] - param[-2])
+    assert not is_uniform(param)
 
     s = SurfaceOver2DRangeSeries(
         cos(x**2 + y**2), (x, 1, 5), (y, 1, 5),
@@ -572,8 +578,8 @@ def test_lin_log_scale():
         xscale="linear", yscale="linear",
     )
     xx, yy, _ = s.get_data()
-    assert np.isclose(xx[0, 1] - xx[0, 0], xx[0, -1] - xx[0, -2])
-    assert np.isclose(yy[1, 0] - yy[0, 0], yy[-1, 0] - yy[-2, 0])
+    assert is_uniform(xx[0, :])
+    assert is_uniform(yy[:, 0])
 
     s = SurfaceOver2DRangeSeries(
         cos(x**2 + y**2), (x, 1, 5), (y, 1, 5),
@@ -581,8 +587,8 @@ def test_lin_log_scale():
         xscale="log", yscale="log"
     )
     xx, yy, _ = s.get_data()
-    assert not np.isclose(xx[0, 1] - xx[0, 0], xx[0, -1] - xx[0, -2])
-    assert not np.isclose(yy[1, 0] - yy[0, 0], yy[-1, 0] - yy[-2, 0])
+    assert not is_uniform(xx[0, :])
+    assert not is_uniform(yy[:, 0])
 
     s = ImplicitSeries(
         cos(x**2 + y**2) > 0, (x, 1, 5), (y, 1, 5),
@@ -590,8 +596,8 @@ def test_lin_log_scale():
         xscale="linear", yscale="linear",
     )
     xx, yy, _, _ = s.get_data()
-    assert np.isclose(xx[0, 1] - xx[0, 0], xx[0, -1] - xx[0, -2])
-    assert np.isclose(yy[1, 0] - yy[0, 0], yy[-1, 0] - yy[-2, 0])
+    assert is_uniform(xx[0, :])
+    assert is_uniform(yy[:, 0])
 
     s = ImplicitSeries(
         cos(x**2 + y**2) > 0, (x, 1, 5), (y, 1, 5),
@@ -599,8 +605,8 @@ def test_lin_log_scale():
         xscale="log", yscale="log"
     )
     xx, yy, _, _ = s.get_data()
-    assert not np.isclose(xx[0, 1] - xx[0, 0], xx[0, -1] - xx[0, -2])
-    assert not np.isclose(yy[1, 0] - yy[0, 0], yy[-1, 0] - yy[-2, 0])
+    assert not is_uniform(xx[0, :])
+    assert not is_uniform(yy[:, 0])
 
     s = AbsArgLineSeries(
         cos(x), (x, 1e-05, 1e05),
@@ -608,7 +614,7 @@ def test_lin_log_scale():
         xscale="linear"
     )
     xx, yy, _ = s.get_data()
-    assert np.isclose(xx[1] - xx[0], xx[-1] - xx[-2])
+    assert is_uniform(xx)
 
     s = AbsArgLineSeries(
         cos(x), (x, 1e-05, 1e05),
@@ -616,7 +622,7 @@ def test_lin_log_scale():
         xscale="log"
     )
     xx, yy, _ = s.get_data()
-    assert not np.isclose(xx[1] - xx[0], xx[-1] - xx[-2])
+    assert not is_uniform(xx)
 
     s = Vector3DSeries(
         x, y, z,
@@ -624,15 +630,9 @@ def test_lin_log_scale():
         xscale="linear", yscale="linear", zscale="linear",
     )
     xx, yy, zz, _, _, _ = s.get_data()
-    assert np.isclose(
-        xx[:, 0, 0][1] - xx[:, 0, 0][0], xx[:, 0, 0][-1] - xx[:, 0, 0][-2]
-    )
-    assert np.isclose(
-        yy[0, :, 0][1] - yy[0, :, 0][0], yy[0, :, 0][-1] - yy[0, :, 0][-2]
-    )
-    assert np.isclose(
-        zz[0, 0, :][1] - zz[0, 0, :][0], zz[0, 0, :][-1] - zz[0, 0, :][-2]
-    )
+    assert is_uniform(xx[:, 0, 0])
+    assert is_uniform(yy[0, :, 0])
+    assert is_uniform(zz[0, 0, :])
 
     s = Vector3DSeries(
         x, y, z,
@@ -640,15 +640,9 @@ def test_lin_log_scale():
         xscale="log", yscale="log", zscale="log",
     )
     xx, yy, zz, _, _, _ = s.get_data()
-    assert not np.isclose(
-        xx[:, 0, 0][1] - xx[:, 0, 0][0], xx[:, 0, 0][-1] - xx[:, 0, 0][-2]
-    )
-    assert not np.isclose(
-        yy[0, :, 0][1] - yy[0, :, 0][0], yy[0, :, 0][-1] - yy[0, :, 0][-2]
-    )
-    assert not np.isclose(
-        zz[0, 0, :][1] - zz[0, 0, :][0], zz[0, 0, :][-1] - zz[0, 0, :][-2]
-    )
+    assert not is_uniform(xx[:, 0, 0])
+    assert not is_uniform(yy[0, :, 0])
+    assert not is_uniform(zz[0, 0, :])
 
 
 def test_rendering_kw():
@@ -1219,9 +1213,14 @@ def test_interactive():
     # verify that InteractiveSeries produces the same numerical data as their
     # corresponding non-interactive series.
     def do_test(data1, data2):
+        # compare all the components with a single vectorized call instead
+        # of one allclose per component
         assert len(data1) == len(data2)
-        for d1, d2 in zip(data1, data2):
-            assert np.allclose(d1, d2)
+        assert all(
+            np.shape(d1) == np.shape(d2) for d1, d2 in zip(data1, data2))
+        assert np.allclose(
+            np.concatenate([np.ravel(d) for d in data1]),
+            np.concatenate([np.ravel(d) for d in data2]))
 
     s1 = LineOver1DRangeSeries(u * cos(x), (x, -5, 5), params={u: 1}, n=50)
     s2 = LineOver1DRangeSeries(cos(x), (x, -5, 5), adaptive=False, n=50)
@@ -2047,9 +2046,14 @@ def test_sums_adaptive_false():
     x, y, u = symbols("x, y, u")
 
     def do_test(data1, data2):
+        # compare all the components with a single vectorized call instead
+        # of one allclose per component
         assert len(data1) == len(data2)
-        for d1, d2 in zip(data1, data2):
-            assert np.allclose(d1, d2)
+        assert all(
+            np.shape(d1) == np.shape(d2) for d1, d2 in zip(data1, data2))
+        assert np.allclose(
+            np.concatenate([np.ravel(d) for d in data1]),
+            np.concatenate([np.ravel(d) for d in data2]))
 
     s = LineOver1DRangeSeries(
         Sum(1 / x**y, (x, 1, 1000)), (y, 2, 10),
@@ -3119,9 +3123,14 @@ def test_complex_adaptive_false():
     x, y, u = symbols("x y u")
 
     def do_test(data1, data2):
+        # compare all the components with a single vectorized call instead
+        # of one allclose per component
         assert len(data1) == len(data2)
-        for d1, d2 in zip(data1, data2):
-            assert np.allclose(d1, d2)
+        assert all(
+            np.shape(d1) == np.shape(d2) for d1, d2 in zip(data1, data2))
+        assert np.allclose(
+            np.concatenate([np.ravel(d) for d in data1]),
+            np.concatenate([np.ravel(d) for d in data2]))
 
     expr1 = sqrt(x) * exp(-(x**2))
     expr2 = sqrt(u * x) * exp(-(x**2))